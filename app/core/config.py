@@ -14,6 +14,7 @@ class Config:
     
     # Optional environment variables with defaults
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    SQLITE_PRAGMAS: str = os.getenv("SQLITE_PRAGMAS", "")  # Applied per connection, e.g. "synchronous=NORMAL,temp_store=MEMORY"
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
     # Application constants
@@ -30,6 +31,10 @@ class Config:
     # YOLO detection settings
     YOLO_CONFIDENCE_THRESHOLD: float = float(os.getenv("YOLO_CONFIDENCE_THRESHOLD", "0.25"))
     YOLO_ENABLED: bool = os.getenv("YOLO_ENABLED", "true").lower() == "true"
+    YOLO_HALF_PRECISION: str = os.getenv("YOLO_HALF_PRECISION", "auto")  # "auto" (CUDA only), "true" (CUDA + MPS) or "false"
+    YOLO_TORCH_COMPILE: bool = os.getenv("YOLO_TORCH_COMPILE", "false").lower() == "true"  # torch.compile the YOLO network
+    YOLO_BATCH_WINDOW_MS: int = int(os.getenv("YOLO_BATCH_WINDOW_MS", "0"))  # Extra wait for more snapshots before an idle pass; 0 runs right away
+    YOLO_MAX_BATCH_SIZE: int = int(os.getenv("YOLO_MAX_BATCH_SIZE", "8"))
     
     # Species identification settings
     SPECIES_IDENTIFICATION_ENABLED: bool = os.getenv("SPECIES_IDENTIFICATION_ENABLED", "true").lower() == "true"
@@ -39,6 +44,8 @@ class Config:
     SPECIES_MODEL: str = os.getenv("SPECIES_MODEL", "qwen/qwen2-vl-3b-instruct")  # LiteLLM format
     SPECIES_CROP_PADDING: float = float(os.getenv("SPECIES_CROP_PADDING", "0.5"))  # 50% padding around bbox
     SPECIES_MIN_CROP_SIZE: int = int(os.getenv("SPECIES_MIN_CROP_SIZE", "224"))  # Minimum crop size in pixels
+    SPECIES_MAX_CONCURRENCY: int = int(os.getenv("SPECIES_MAX_CONCURRENCY", "2"))  # Parallel species requests per snapshot
+    SPECIES_TORCH_COMPILE: bool = os.getenv("SPECIES_TORCH_COMPILE", "false").lower() == "true"  # torch.compile the local Qwen model
     
     # Ollama settings (when using provider="ollama")
     OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
@@ -55,6 +62,13 @@ class Config:
     # YOLO model settings
     MODELS_DIR: Path = Path("data/models")
     YOLO_MODEL_NAME: str = "yolo11n.pt"
+    YOLO_EXPORT_FORMAT: str = os.getenv("YOLO_EXPORT_FORMAT", "")  # e.g. "engine", "coreml", "onnx" or "auto" (TensorRT on CUDA, CoreML on Apple Silicon); empty runs the .pt model
+    YOLO_EXPORT_INT8: bool = os.getenv("YOLO_EXPORT_INT8", "false").lower() == "true"  # Quantize the exported model to int8 (openvino, coreml, engine, tflite)
+    HF_CACHE_DIR: Path = Path(os.getenv("HF_CACHE_DIR", str(MODELS_DIR / "huggingface")))  # Persistent Hugging Face model cache
+    YOLO_MODEL_URL: str = os.getenv(
+        "YOLO_MODEL_URL",
+        f"https://github.com/ultralytics/assets/releases/download/v8.3.0/{YOLO_MODEL_NAME}"
+    )  # Fetched with resume support when the model file is missing
     
     # AI Model configuration  
     AI_MODEL: str = os.getenv("AI_MODEL", "gpt-4o")  # LiteLLM model name
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Generator
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
 
 from app.core.config import config
@@ -20,6 +21,28 @@ else:
 engine = create_engine(DATABASE_URL, echo=False)
 
 
+def _parse_sqlite_pragmas(pragmas: str) -> list[tuple[str, str]]:
+    """Parse "name=value,name=value" into (name, value) pairs."""
+    parsed = []
+    for item in pragmas.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip().isidentifier() and value.strip():
+            parsed.append((name.strip(), value.strip()))
+    return parsed
+
+
+if DATABASE_URL.startswith("sqlite") and config.SQLITE_PRAGMAS:
+    _sqlite_pragmas = _parse_sqlite_pragmas(config.SQLITE_PRAGMAS)
+    
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply configured PRAGMAs to every new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in _sqlite_pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
 def create_db_and_tables() -> None:
     """Create all database tables."""
     # Import all models to register them with SQLModel
@@ -4,8 +4,9 @@ Dummy Surveillance Integration
 Simulates a surveillance system with a single camera for testing purposes.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import functools
 import random
 import asyncio
 from enum import Enum
@@ -14,6 +15,30 @@ import os
 from app.integrations.base import IntegrationBase, DeviceInterface
 
 
+SCENARIOS_PATH = Path("public/dummy-surveillance")
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+@functools.lru_cache(maxsize=64)
+def _scan_images(directory: str, mtime_ns: int, extensions: Tuple[str, ...]) -> Tuple[Path, ...]:
+    """Scan a directory for images, ordered by extension then name.
+    
+    The directory mtime is part of the cache key, so adding or removing
+    images invalidates the cached listing without rescanning on every call.
+    """
+    by_extension: Dict[str, List[Path]] = {ext: [] for ext in extensions}
+    for entry in Path(directory).iterdir():
+        suffix = entry.suffix.lower()
+        if suffix in by_extension and entry.is_file():
+            by_extension[suffix].append(entry)
+    return tuple(path for ext in extensions for path in sorted(by_extension[ext]))
+
+
+def _list_images(directory: Path, extensions: Tuple[str, ...] = IMAGE_EXTENSIONS) -> Tuple[Path, ...]:
+    """Return the (cached) images in a scenario directory."""
+    return _scan_images(str(directory), directory.stat().st_mtime_ns, extensions)
+
+
 class IntegrationStatus(str, Enum):
     CONNECTED = "connected"
     DISCONNECTED = "disconnected"
@@ -210,17 +235,16 @@ class DummySurveillanceIntegration(IntegrationBase):
         import logging
         
         logger = logging.getLogger(__name__)
-        base_path = Path("public/dummy-surveillance")
+        base_path = SCENARIOS_PATH
         
         if not base_path.exists():
             logger.warning(f"Test images directory not found: {base_path}")
             return
             
-        # Scan all subdirectories for images
+        # Scan all subdirectories for images, reading each directory once
         for scenario_dir in base_path.iterdir():
             if scenario_dir.is_dir():
-                images = list(scenario_dir.glob("*.jpg")) + list(scenario_dir.glob("*.png"))
-                for image in images:
+                for image in _list_images(scenario_dir, ('.jpg', '.png')):
                     relative_path = str(image.relative_to(Path("public")))
                     self._scenarios.append({
                         "scenario": scenario_dir.name,
@@ -245,7 +269,7 @@ class DummySurveillanceIntegration(IntegrationBase):
     @staticmethod
     def get_test_scenarios() -> List[str]:
         """Get available test scenarios."""
-        scenarios_path = Path("public/dummy-surveillance")
+        scenarios_path = SCENARIOS_PATH
         if not scenarios_path.exists():
             return []
         
@@ -258,16 +282,13 @@ class DummySurveillanceIntegration(IntegrationBase):
     
     def set_test_scenario(self, scenario: str) -> Dict[str, Any]:
         """Set the current test scenario and pick a random image."""
-        scenarios_path = Path("public/dummy-surveillance")
-        scenario_path = scenarios_path / scenario
+        scenario_path = SCENARIOS_PATH / scenario
         
         if not scenario_path.exists():
             return {"error": f"Scenario '{scenario}' not found"}
         
         # Find all image files in the scenario folder
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-        images = [f for f in scenario_path.iterdir() 
-                 if f.is_file() and f.suffix.lower() in image_extensions]
+        images = _list_images(scenario_path)
         
         if not images:
             return {"error": f"No images found in scenario '{scenario}'"}
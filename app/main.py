@@ -9,9 +9,13 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from pathlib import Path
 
+# Let ops without an MPS kernel run on CPU instead of failing, so YOLO can
+# stay on the Apple GPU. Set before the imports below pull in torch.
+os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
 from fastapi import FastAPI, Request, Depends
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from sqlmodel import Session, select
 
 from app.core.config import config
@@ -83,11 +87,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await detection_worker.stop()
 
 # Initialize FastAPI app
+# Use orjson for API responses when it is installed (C encoder), else stdlib json
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    DefaultJSONResponse = JSONResponse
+
+
 app = FastAPI(
     title="Foe Be Gone",
     description="AI-powered wildlife detection and deterrent system",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
     openapi_tags=[
         {
             "name": "dashboard",
@@ -1,5 +1,6 @@
 """API endpoints for detection data."""
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -11,8 +12,6 @@ from app.core.database import get_session
 from app.models.detection import Detection, Foe
 from app.models.device import Device
 from app.services.yolo_detector import YOLOv11DetectionService
-from PIL import Image
-import io
 import base64
 
 logger = logging.getLogger(__name__)
@@ -129,36 +128,12 @@ async def get_detection_with_boxes(
         raise HTTPException(status_code=404, detail="No YOLO detections available")
     
     try:
-        # Load the image
-        image = Image.open(detection.image_path)
-        
-        # Initialize YOLO service for drawing
-        yolo_service = YOLOv11DetectionService()
-        
-        # Convert YOLO results back to detection objects for drawing
-        from app.services.yolo_detector import YOLODetection
-        detections = []
-        for det in yolo_results["detections"]:
-            yolo_det = YOLODetection(
-                class_id=0,  # Not needed for drawing
-                class_name=det["class_name"],
-                confidence=det["confidence"],
-                bbox=tuple(det["bbox"]),
-                category=det["category"]
-            )
-            detections.append(yolo_det)
-        
-        # Draw bounding boxes
-        image_with_boxes = yolo_service.draw_detections(
-            image, 
-            detections,
-            yolo_results.get("foe_classifications", {})
+        jpeg_bytes = await asyncio.to_thread(
+            YOLOv11DetectionService.render_stored_detections_jpeg,
+            detection.image_path,
+            yolo_results
         )
-        
-        # Convert to base64 for response
-        buffered = io.BytesIO()
-        image_with_boxes.save(buffered, format="JPEG")
-        img_base64 = base64.b64encode(buffered.getvalue()).decode()
+        img_base64 = base64.b64encode(jpeg_bytes).decode()
         
         return {
             "detection_id": detection_id,
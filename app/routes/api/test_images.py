@@ -1,12 +1,13 @@
 """API endpoints for test image management."""
 
+import logging
 import os
 import shutil
 import time
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlmodel import Session, select
@@ -19,6 +20,7 @@ from app.services.ollama_species_detector import OllamaSpeciesDetector
 from app.services.litellm_species_detector import LiteLLMSpeciesDetector
 from app.models.provider import Provider, ProviderModel
 
+logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/tests", tags=["tests"])
 
 
@@ -484,6 +486,65 @@ async def create_test_run(
     }
 
 
+def _load_test_image(image_path: str) -> Image.Image:
+    """Open and fully decode a test image so its file handle can close."""
+    with Image.open(image_path) as img:
+        img.load()
+        return img
+
+
+def _create_species_detector(session: Session, model_name: str) -> Tuple[Any, str]:
+    """Create the species detector for a test model name.
+    
+    Returns:
+        Tuple of (detector, provider display name)
+    """
+    if model_name.startswith("cloud:"):
+        # Parse cloud model format: cloud:provider:model_id
+        parts = model_name.split(":", 2)
+        if len(parts) != 3:
+            raise ValueError("Invalid cloud model format")
+        
+        provider_name = parts[1]
+        model_id = parts[2]
+        
+        # Get provider and model config
+        provider = session.exec(
+            select(Provider).where(Provider.name == provider_name)
+        ).first()
+        
+        if not provider:
+            raise ValueError(f"Provider {provider_name} not found")
+        
+        model_config = session.exec(
+            select(ProviderModel)
+            .where(ProviderModel.provider_id == provider.id)
+            .where(ProviderModel.model_id == model_id)
+        ).first()
+        
+        if not model_config:
+            raise ValueError(f"Model {model_id} not found")
+        
+        detector = LiteLLMSpeciesDetector(
+            provider_config={
+                "name": provider.name,
+                "api_key": provider.api_key,
+                "api_base": provider.api_base,
+                "config": provider.config
+            },
+            model_config={
+                "model_id": model_config.model_id,
+                "cost_per_1k_tokens": model_config.cost_per_1k_tokens,
+                "config": model_config.config
+            }
+        )
+        return detector, provider_name
+    else:
+        # Ollama model
+        detector = OllamaSpeciesDetector(model=model_name)
+        return detector, "ollama"
+
+
 async def run_test_background(test_run_id: int, test_image_ids: List[int], model_names: List[str]):
     """Run tests in the background."""
     from app.core.database import get_session
@@ -509,12 +570,23 @@ async def run_test_background(test_run_id: int, test_image_ids: List[int], model
         
         import time
         
+        detectors: Dict[str, Tuple[Any, str]] = {}
+        
+        def prefetch(index: int) -> Optional[asyncio.Task]:
+            if index >= len(test_images):
+                return None
+            return asyncio.create_task(asyncio.to_thread(_load_test_image, test_images[index].image_path))
+        
+        next_image = prefetch(0)
+        
         try:
-            for test_image in test_images:
+            for index, test_image in enumerate(test_images):
+                # Decode the following image while this one is being tested
+                current_image, next_image = next_image, prefetch(index + 1)
+                
                 # Load image
                 try:
-                    with Image.open(test_image.image_path) as img:
-                        image = img.copy()
+                    image = await current_image
                 except Exception as e:
                     # Mark all tests for this image as failed
                     for model_name in model_names:
@@ -540,56 +612,16 @@ async def run_test_background(test_run_id: int, test_image_ids: List[int], model
                 if not bboxes:
                     bboxes = [(0, 0, image.width, image.height)]
                 
-                # Test each model
-                for model_name in model_names:
+                # Test one model; results are written to the session by the caller
+                async def test_model(model_name: str) -> TestResult:
                     test_start = time.time()
+                    provider_display = "unknown"
                     
                     try:
-                        # Create appropriate detector
-                        if model_name.startswith("cloud:"):
-                            # Parse cloud model format: cloud:provider:model_id
-                            parts = model_name.split(":", 2)
-                            if len(parts) != 3:
-                                raise ValueError("Invalid cloud model format")
-                            
-                            provider_name = parts[1]
-                            model_id = parts[2]
-                            
-                            # Get provider and model config
-                            provider = session.exec(
-                                select(Provider).where(Provider.name == provider_name)
-                            ).first()
-                            
-                            if not provider:
-                                raise ValueError(f"Provider {provider_name} not found")
-                            
-                            model_config = session.exec(
-                                select(ProviderModel)
-                                .where(ProviderModel.provider_id == provider.id)
-                                .where(ProviderModel.model_id == model_id)
-                            ).first()
-                            
-                            if not model_config:
-                                raise ValueError(f"Model {model_id} not found")
-                            
-                            detector = LiteLLMSpeciesDetector(
-                                provider_config={
-                                    "name": provider.name,
-                                    "api_key": provider.api_key,
-                                    "api_base": provider.api_base,
-                                    "config": provider.config
-                                },
-                                model_config={
-                                    "model_id": model_config.model_id,
-                                    "cost_per_1k_tokens": model_config.cost_per_1k_tokens,
-                                    "config": model_config.config
-                                }
-                            )
-                            provider_display = provider_name
-                        else:
-                            # Ollama model
-                            detector = OllamaSpeciesDetector(model=model_name)
-                            provider_display = "ollama"
+                        # Reuse one detector (and its HTTP client) per model across images
+                        if model_name not in detectors:
+                            detectors[model_name] = _create_species_detector(session, model_name)
+                        detector, provider_display = detectors[model_name]
                         
                         # Test on all bounding boxes
                         detections = []
@@ -625,7 +657,7 @@ async def run_test_background(test_run_id: int, test_image_ids: List[int], model
                         f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
                         
                         # Create test result
-                        test_result = TestResult(
+                        return TestResult(
                             test_image_id=test_image.id,
                             test_run_id=test_run.id,
                             model_name=model_name,
@@ -642,28 +674,46 @@ async def run_test_background(test_run_id: int, test_image_ids: List[int], model
                             f1_score=f1_score
                         )
                         
-                        session.add(test_result)
-                        completed_tests += 1
-                        total_cost += test_cost
-                        total_time += test_duration / 1000  # Convert back to seconds
-                        
-                        # Commit after each test for live progress
-                        session.commit()
-                        
                     except Exception as e:
                         # Record failed test
-                        test_result = TestResult(
+                        return TestResult(
                             test_image_id=test_image.id,
                             test_run_id=test_run.id,
                             model_name=model_name,
-                            provider_name=provider_display if 'provider_display' in locals() else "unknown",
+                            provider_name=provider_display,
                             inference_time_ms=0,
                             total_time_ms=(time.time() - test_start) * 1000,
                             error=str(e)
                         )
-                        session.add(test_result)
+                
+                image_start = time.time()
+                results: List[Optional[TestResult]] = [None] * len(model_names)
+                
+                # Local models (Ollama) share this machine's CPU/GPU, so running
+                # them side by side would inflate each other's latency; test
+                # them one at a time. Cloud models don't contend and are
+                # tested concurrently.
+                cloud_indices = [i for i, name in enumerate(model_names) if name.startswith("cloud:")]
+                for i, model_name in enumerate(model_names):
+                    if i not in cloud_indices:
+                        results[i] = await test_model(model_name)
+                cloud_results = await asyncio.gather(*(test_model(model_names[i]) for i in cloud_indices))
+                for i, test_result in zip(cloud_indices, cloud_results):
+                    results[i] = test_result
+                
+                # Wall-clock time, so concurrent tests aren't counted twice
+                total_time += time.time() - image_start
+                
+                for test_result in results:
+                    session.add(test_result)
+                    if test_result.error:
                         failed_tests += 1
-                        session.commit()
+                    else:
+                        completed_tests += 1
+                        total_cost += test_result.cost
+                
+                # Commit after each image for live progress
+                session.commit()
             
             # Update test run with final results
             test_run.completed_tests = completed_tests
@@ -679,6 +729,18 @@ async def run_test_background(test_run_id: int, test_image_ids: List[int], model
             test_run.status = "failed"
             test_run.completed_at = datetime.utcnow()
             session.commit()
+        
+        finally:
+            if next_image is not None:
+                next_image.cancel()
+            
+            # Release pooled HTTP connections held by the detectors
+            for detector, _ in detectors.values():
+                if hasattr(detector, "close"):
+                    try:
+                        await detector.close()
+                    except Exception as e:
+                        logger.warning(f"Failed to close species detector: {e}")
 
 
 @router.get("/test-runs", summary="List all test runs")
@@ -1,7 +1,11 @@
 """Routes for detection management and viewing."""
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import io
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -26,7 +30,7 @@ from app.services.camera_diagnostics import camera_diagnostics
 from app.models.setting import Setting
 from app.models.sound_effectiveness import SoundEffectiveness
 from app.services.settings_service import SettingsService
-from app.services.qwen_species_detector import QwenSpeciesDetector
+from app.services.qwen_species_detector import species_detector
 from app.services.detection_grouping_service import DetectionGroupingService
 from app.utils.image_utils import crop_image_with_padding, get_cached_resized_image, create_cached_resized_image
 
@@ -440,6 +444,156 @@ async def test_sound_on_camera(
         raise HTTPException(status_code=500, detail=f"Error testing sound on camera: {str(e)}")
 
 
+# Label font for foe boxes, loaded lazily on first use
+_LABEL_FONT = None
+_LABEL_FONT_PATHS = [
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Avenir.ttc"
+]
+
+
+def _get_label_font():
+    """Return the label font, probing system font paths only once."""
+    global _LABEL_FONT
+    if _LABEL_FONT is None:
+        font = None
+        try:
+            for font_path in _LABEL_FONT_PATHS:
+                if Path(font_path).exists():
+                    font = ImageFont.truetype(font_path, 16)
+                    break
+        except Exception:
+            font = None
+        _LABEL_FONT = font or ImageFont.load_default()
+    return _LABEL_FONT
+
+
+# Rendered detection images with boxes; the oldest are pruned past the cap
+BOXES_CACHE_DIR = Path("data/cache/boxes")
+BOXES_CACHE_MAX_FILES = 500
+
+
+def _boxes_cache_path(image_path: str, yolo_results: Dict[str, Any], foes: List[Foe]) -> Path:
+    """Return the cache file for a rendered detection image.
+    
+    The key covers the source image and everything that is drawn on it, so
+    a changed image or edited boxes produce a new render.
+    """
+    drawn = {
+        "image": image_path,
+        "mtime": Path(image_path).stat().st_mtime_ns,
+        "yolo": yolo_results.get("detections"),
+        "foes": [(foe.foe_type, foe.confidence, foe.bounding_box) for foe in foes],
+    }
+    cache_key = hashlib.md5(json.dumps(drawn, sort_keys=True, default=str).encode()).hexdigest()
+    return BOXES_CACHE_DIR / f"{cache_key}.jpg"
+
+
+def _render_detection_image_cached(
+    image_path: str,
+    ai_response: Optional[Dict[str, Any]],
+    foes: List[Foe],
+    cache_path: Path
+) -> Path:
+    """Render a detection image with boxes once and keep it on disk."""
+    content = _render_detection_image_with_boxes(image_path, ai_response, foes)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, cache_path)
+    _prune_boxes_cache()
+    return cache_path
+
+
+def _prune_boxes_cache():
+    """Delete the oldest rendered images once the cache exceeds its cap.
+    
+    Every edit of a detection's boxes produces a new render, so without a
+    cap the cache would grow for as long as the device runs.
+    """
+    renders = []
+    for path in BOXES_CACHE_DIR.glob("*.jpg"):
+        try:
+            renders.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    
+    if len(renders) <= BOXES_CACHE_MAX_FILES:
+        return
+    
+    renders.sort()
+    for _, path in renders[:len(renders) - BOXES_CACHE_MAX_FILES]:
+        path.unlink(missing_ok=True)
+
+
+def _render_detection_image_with_boxes(
+    image_path: str,
+    ai_response: Optional[Dict[str, Any]],
+    foes: List[Foe]
+) -> bytes:
+    """Draw bounding boxes onto a detection image and encode it as JPEG."""
+    # Option 1: Use YOLO results if available
+    if ai_response and "yolo_results" in ai_response:
+        yolo_results = ai_response["yolo_results"]
+        if yolo_results.get("detections"):
+            from app.services.yolo_detector import YOLOv11DetectionService
+            return YOLOv11DetectionService.render_stored_detections_jpeg(image_path, yolo_results)
+    
+    # Load the original image
+    image = Image.open(image_path).convert('RGB')
+    
+    # Option 2: Fall back to foe bounding boxes if no YOLO results
+    if foes:
+        draw = ImageDraw.Draw(image)
+        
+        # Define colors for different foe types
+        colors = {
+            "rats": "#ef4444",     # red
+            "crows": "#f59e0b",    # amber
+            "cats": "#10b981",     # green
+            "herons": "#3b82f6",   # blue
+            "pigeons": "#8b5cf6",  # purple
+            "unknown": "#6b7280"   # gray
+        }
+        
+        for foe in foes:
+            if foe.bounding_box and "x" in foe.bounding_box:
+                # Extract coordinates
+                x = foe.bounding_box.get("x", 0)
+                y = foe.bounding_box.get("y", 0)
+                width = foe.bounding_box.get("width", 0)
+                height = foe.bounding_box.get("height", 0)
+                
+                # Calculate box corners
+                x1, y1 = x, y
+                x2, y2 = x + width, y + height
+                
+                # Get color for foe type
+                color = colors.get(foe.foe_type.lower(), colors["unknown"])
+                
+                # Draw rectangle
+                draw.rectangle([x1, y1, x2, y2], outline=color, width=3)
+                
+                # Draw label with confidence
+                label = f"{foe.foe_type} {foe.confidence:.0%}"
+                font = _get_label_font()
+                
+                # Get text bbox for background
+                bbox = draw.textbbox((x1, y1), label, font=font)
+                
+                # Draw label background
+                draw.rectangle([bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2], fill=color)
+                
+                # Draw label text
+                draw.text((x1, y1), label, fill="white", font=font)
+    
+    # Convert image to bytes
+    img_buffer = io.BytesIO()
+    image.save(img_buffer, format='JPEG', quality=85)
+    return img_buffer.getvalue()
+
+
 @router.get("/image-with-boxes/{detection_id}", include_in_schema=False)
 async def serve_detection_image_with_boxes(
     detection_id: int,
@@ -453,110 +607,28 @@ async def serve_detection_image_with_boxes(
     if not detection.image_path or not Path(detection.image_path).exists():
         raise HTTPException(status_code=404, detail="No image available for this detection")
     
+    # Nothing to draw: serve the original file without decoding/re-encoding it
+    yolo_results = (detection.ai_response or {}).get("yolo_results") or {}
+    has_foe_boxes = any(
+        foe.bounding_box and "x" in foe.bounding_box for foe in detection.foes
+    )
+    if not yolo_results.get("detections") and not has_foe_boxes:
+        return FileResponse(detection.image_path)
+    
     try:
-        # Load the original image
-        image = Image.open(detection.image_path).convert('RGB')
-        
-        # Check if we have YOLO results or foe bounding boxes
-        draw_boxes = False
-        
-        # Option 1: Use YOLO results if available
-        if detection.ai_response and "yolo_results" in detection.ai_response:
-            yolo_results = detection.ai_response["yolo_results"]
-            if yolo_results.get("detections"):
-                draw_boxes = True
-                # Use YOLO service to draw boxes
-                from app.services.yolo_detector import YOLOv11DetectionService, YOLODetection
-                
-                yolo_service = YOLOv11DetectionService()
-                detections_list = []
-                
-                for det in yolo_results["detections"]:
-                    yolo_det = YOLODetection(
-                        class_id=0,  # Not needed for drawing
-                        class_name=det["class_name"],
-                        confidence=det["confidence"],
-                        bbox=tuple(det["bbox"]),
-                        category=det.get("category", "unknown")
-                    )
-                    detections_list.append(yolo_det)
-                
-                # Draw bounding boxes
-                image = yolo_service.draw_detections(
-                    image, 
-                    detections_list,
-                    yolo_results.get("foe_classifications", {})
-                )
-        
-        # Option 2: Fall back to foe bounding boxes if no YOLO results
-        if not draw_boxes and detection.foes:
-            draw = ImageDraw.Draw(image)
-            
-            # Define colors for different foe types
-            colors = {
-                "rats": "#ef4444",     # red
-                "crows": "#f59e0b",    # amber
-                "cats": "#10b981",     # green
-                "herons": "#3b82f6",   # blue
-                "pigeons": "#8b5cf6",  # purple
-                "unknown": "#6b7280"   # gray
-            }
-            
-            for foe in detection.foes:
-                if foe.bounding_box and "x" in foe.bounding_box:
-                    # Extract coordinates
-                    x = foe.bounding_box.get("x", 0)
-                    y = foe.bounding_box.get("y", 0)
-                    width = foe.bounding_box.get("width", 0)
-                    height = foe.bounding_box.get("height", 0)
-                    
-                    # Calculate box corners
-                    x1, y1 = x, y
-                    x2, y2 = x + width, y + height
-                    
-                    # Get color for foe type
-                    color = colors.get(foe.foe_type.lower(), colors["unknown"])
-                    
-                    # Draw rectangle
-                    draw.rectangle([x1, y1, x2, y2], outline=color, width=3)
-                    
-                    # Draw label with confidence
-                    label = f"{foe.foe_type} {foe.confidence:.0%}"
-                    try:
-                        # Try to use a system font
-                        font = None
-                        font_paths = [
-                            "/System/Library/Fonts/Helvetica.ttc",
-                            "/Library/Fonts/Arial.ttf",
-                            "/System/Library/Fonts/Avenir.ttc"
-                        ]
-                        for font_path in font_paths:
-                            if Path(font_path).exists():
-                                font = ImageFont.truetype(font_path, 16)
-                                break
-                        if not font:
-                            font = ImageFont.load_default()
-                    except:
-                        font = ImageFont.load_default()
-                    
-                    # Get text bbox for background
-                    bbox = draw.textbbox((x1, y1), label, font=font)
-                    
-                    # Draw label background
-                    draw.rectangle([bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2], fill=color)
-                    
-                    # Draw label text
-                    draw.text((x1, y1), label, fill="white", font=font)
-        
-        # Convert image to bytes
-        img_buffer = io.BytesIO()
-        image.save(img_buffer, format='JPEG', quality=85)
-        img_buffer.seek(0)
+        # Boxes never change after processing; render once, then serve the file
+        foes = list(detection.foes)
+        cache_path = _boxes_cache_path(detection.image_path, yolo_results, foes)
+        if not cache_path.exists():
+            await asyncio.to_thread(
+                _render_detection_image_cached,
+                detection.image_path,
+                detection.ai_response,
+                foes,
+                cache_path
+            )
         
-        return Response(
-            content=img_buffer.getvalue(),
-            media_type="image/jpeg"
-        )
+        return FileResponse(cache_path, media_type="image/jpeg")
         
     except Exception as e:
         logger.error(f"Error processing detection image: {e}")
@@ -930,7 +1002,7 @@ async def get_species_detector_health(session: Session = Depends(get_session)) -
         Dict containing health status and configuration
     """
     try:
-        species_detector = QwenSpeciesDetector(session=session)
+        # Report on the shared detector; a fresh instance never has its model loaded
         health_status = species_detector.health_check()
         
         return {
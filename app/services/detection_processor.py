@@ -1,10 +1,14 @@
 """Detection processing service for analyzing images and managing detections."""
 
+import asyncio
+import copy
+import hashlib
 import logging
 import io
 import os
 import uuid
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -15,13 +19,16 @@ from sqlmodel import Session, select
 from app.models.device import Device
 from app.models.detection import Detection, Foe, DetectionStatus, DeterrentAction, FoeType
 from app.models.setting import Setting
-from app.services.yolo_detector import YOLOv11DetectionService, YOLODetection
+from app.services.yolo_detector import YOLODetection, get_yolo_service
 from app.services.visual_hash_service import calculate_detection_hash
 from app.core.session import get_db_session, safe_commit
 from app.core.config import config
 
 logger = logging.getLogger(__name__)
 
+# YOLO results kept for recently seen snapshot contents
+YOLO_RESULT_CACHE_SIZE = 32
+
 
 class DetectionProcessor:
     """Processes camera snapshots to detect foes and manage detection records."""
@@ -34,15 +41,21 @@ class DetectionProcessor:
             use_yolo: Whether to use YOLO for initial animal detection (None = use config)
         """
         self.use_yolo = use_yolo if use_yolo is not None else config.YOLO_ENABLED
+        
+        # Create snapshots directory once rather than on every save
+        config.SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
         self.yolo_confidence_threshold = config.YOLO_CONFIDENCE_THRESHOLD
         self.yolo_detector = None
         self.species_detector = None
         self._ollama_detector = None  # Keep reference for cleanup
         
+        # Snapshot content digest -> YOLO results, for unchanged frames
+        self._yolo_result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
         # Initialize YOLO detector if enabled
         if self.use_yolo:
             try:
-                self.yolo_detector = YOLOv11DetectionService()
+                self.yolo_detector = get_yolo_service()
                 logger.info(f"YOLOv11 detector initialized successfully (confidence threshold: {self.yolo_confidence_threshold})")
             except Exception as e:
                 logger.error(f"Failed to initialize YOLO detector: {e}")
@@ -61,9 +74,9 @@ class DetectionProcessor:
                     self.species_detector = self._ollama_detector
                     logger.info(f"Ollama species detector initialized with model: {config.OLLAMA_MODEL}")
                 else:
-                    # Use Qwen detector - import only when needed
-                    from app.services.qwen_species_detector import QwenSpeciesDetector
-                    self.species_detector = QwenSpeciesDetector()
+                    # Use the shared Qwen detector so its weights load once per process
+                    from app.services.qwen_species_detector import species_detector
+                    self.species_detector = species_detector
                     logger.info("Qwen species detector initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize species detector ({config.SPECIES_IDENTIFICATION_PROVIDER}): {e}")
@@ -75,9 +88,6 @@ class DetectionProcessor:
         
     def save_snapshot(self, image_data: bytes, camera_name: str) -> Path:
         """Save snapshot image to disk."""
-        # Create snapshots directory if needed
-        config.SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-        
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{camera_name}_{timestamp}_{uuid.uuid4().hex[:8]}.jpg"
@@ -93,24 +103,39 @@ class DetectionProcessor:
             logger.error(f"Failed to save snapshot: {e}")
             raise
     
-    def run_yolo_detection(self, image_data: bytes) -> Dict[str, Any]:
+    async def run_yolo_detection(self, image_data: bytes) -> Dict[str, Any]:
         """Run YOLO detection on image data.
         
+        A snapshot runs right away when the model is idle. Snapshots that
+        queue up while a pass is running go through together as one batch.
+        
         Returns:
             Dict containing detection results and metadata
         """
         if not self.yolo_detector:
             return {"detections": [], "foe_classifications": {}, "yolo_duration_ms": 0}
         
+        # Static scenes and test cameras often return byte-identical frames
+        digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        cached = self._yolo_result_cache.get(digest)
+        if cached is not None:
+            self._yolo_result_cache.move_to_end(digest)
+            logger.info(f"Snapshot unchanged, reusing YOLO results ({cached['total_animals']} animals)")
+            # Callers annotate the results in place, so never hand out the cached objects
+            results = copy.deepcopy(cached)
+            results["yolo_duration_ms"] = 0
+            return results
+        
         start_time = time.time()
         try:
-            # Convert bytes to PIL Image
-            image = Image.open(io.BytesIO(image_data))
+            # Decode straight to the BGR array YOLO consumes, off the event loop
+            image = await asyncio.to_thread(self.yolo_detector.decode_image_bgr, image_data)
+            decode_ms = round((time.time() - start_time) * 1000)
             
-            # Get YOLO detections (animals only) with configured confidence threshold
-            detections = self.yolo_detector.detect_animals(
-                image, 
-                confidence_threshold=self.yolo_confidence_threshold
+            # Get YOLO detections (animals only) with configured confidence threshold.
+            # Time spent queued behind another pass is not counted.
+            detections, inference_ms = await self.yolo_detector.detect_queued(
+                image, self.yolo_confidence_threshold
             )
             
             # Convert to serializable format
@@ -123,10 +148,10 @@ class DetectionProcessor:
                     "category": det.category
                 })
             
-            duration_ms = round((time.time() - start_time) * 1000)
+            duration_ms = decode_ms + inference_ms
             logger.info(f"YOLO detection completed in {duration_ms}ms, found {len(detections)} animals")
             
-            return {
+            results = {
                 "detections": detection_data,
                 "foe_classifications": {},  # No longer done by YOLO
                 "total_animals": len(detections),  # All detections are animals
@@ -134,6 +159,12 @@ class DetectionProcessor:
                 "yolo_duration_ms": duration_ms
             }
             
+            self._yolo_result_cache[digest] = copy.deepcopy(results)
+            if len(self._yolo_result_cache) > YOLO_RESULT_CACHE_SIZE:
+                self._yolo_result_cache.popitem(last=False)
+            
+            return results
+            
         except Exception as e:
             duration_ms = round((time.time() - start_time) * 1000)
             logger.error(f"Error running YOLO detection after {duration_ms}ms: {e}")
@@ -160,51 +191,54 @@ class DetectionProcessor:
             # Convert bytes to PIL Image
             image = Image.open(io.BytesIO(image_data))
             
-            species_results = []
-            total_cost = 0.0
+            # Bound concurrent requests so a busy frame doesn't flood the backend
+            semaphore = asyncio.Semaphore(max(1, config.SPECIES_MAX_CONCURRENCY))
             
-            # Identify species for each detected object
-            for i, detection in enumerate(yolo_results["detections"]):
+            async def identify(i: int, detection: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 bbox = detection.get("bbox")
                 if not bbox or len(bbox) != 4:
-                    continue
+                    return None
                 
-                detection_start = time.time()
-                try:
-                    # Run species identification on cropped region
-                    species_result = await self.species_detector.identify_species(
-                        image, 
-                        tuple(bbox)  # Convert to tuple (x1, y1, x2, y2)
-                    )
-                    
-                    detection_duration = round((time.time() - detection_start) * 1000)
-                    
-                    # Add detection context
-                    result_dict = {
-                        "original_detection": detection,
-                        "species_result": species_result.model_dump(),
-                        "bbox": bbox,
-                        "detection_duration_ms": detection_duration
-                    }
-                    
-                    species_results.append(result_dict)
-                    
-                    if species_result.cost:
-                        total_cost += species_result.cost
-                    
-                    # Log the identification
-                    if species_result.identifications:
-                        species_id = species_result.identifications[0]
-                        logger.info(f"Species identified in {detection_duration}ms: {species_id.species} "
-                                  f"(foe_type: {species_id.foe_type}, "
-                                  f"confidence: {species_id.confidence:.2f})")
-                    else:
-                        logger.info(f"No species identified in {detection_duration}ms for detection {i+1}")
+                async with semaphore:
+                    detection_start = time.time()
+                    try:
+                        # Run species identification on cropped region
+                        species_result = await self.species_detector.identify_species(
+                            image, 
+                            tuple(bbox)  # Convert to tuple (x1, y1, x2, y2)
+                        )
+                    except Exception as e:
+                        detection_duration = round((time.time() - detection_start) * 1000)
+                        logger.error(f"Error identifying species for detection {i+1} after {detection_duration}ms: {e}")
+                        return None
                 
-                except Exception as e:
-                    detection_duration = round((time.time() - detection_start) * 1000)
-                    logger.error(f"Error identifying species for detection {i+1} after {detection_duration}ms: {e}")
-                    continue
+                detection_duration = round((time.time() - detection_start) * 1000)
+                
+                # Log the identification
+                if species_result.identifications:
+                    species_id = species_result.identifications[0]
+                    logger.info(f"Species identified in {detection_duration}ms: {species_id.species} "
+                              f"(foe_type: {species_id.foe_type}, "
+                              f"confidence: {species_id.confidence:.2f})")
+                else:
+                    logger.info(f"No species identified in {detection_duration}ms for detection {i+1}")
+                
+                # Add detection context
+                return {
+                    "original_detection": detection,
+                    "species_result": species_result.model_dump(),
+                    "bbox": bbox,
+                    "detection_duration_ms": detection_duration
+                }
+            
+            # Identify species for all detected objects concurrently, keeping YOLO order
+            results = await asyncio.gather(
+                *(identify(i, detection) for i, detection in enumerate(yolo_results["detections"]))
+            )
+            species_results = [result for result in results if result is not None]
+            total_cost = sum(
+                result["species_result"].get("cost") or 0.0 for result in species_results
+            )
             
             total_duration_ms = round((time.time() - start_time) * 1000)
             avg_duration_per_detection = round(total_duration_ms / detections_count) if detections_count > 0 else 0
@@ -254,8 +288,8 @@ class DetectionProcessor:
         # Track overall processing time
         processing_start_time = time.time()
         
-        # Save snapshot
-        image_path = self.save_snapshot(image_data, camera.name)
+        # Write the snapshot in a worker thread while detection runs
+        save_task = asyncio.create_task(asyncio.to_thread(self.save_snapshot, image_data, camera.name))
         
         # Run YOLO detection first if enabled
         yolo_results = None
@@ -264,35 +298,46 @@ class DetectionProcessor:
         foes_detected = False
         total_ai_cost = 0.0
         
-        if self.use_yolo:
-            logger.info(f"Running YOLO animal detection for {camera.name}")
-            yolo_results = self.run_yolo_detection(image_data)
-            animals_detected = yolo_results.get("total_animals", 0) > 0
-            
-            # Run species identification on detected animals
-            if yolo_results.get("detections") and self.species_detector:
-                logger.info(f"Running species identification for {len(yolo_results['detections'])} detected animals in {camera.name}")
-                species_results = await self.run_species_identification(image_data, yolo_results)
-                total_ai_cost += species_results.get("total_cost", 0.0)
+        try:
+            if self.use_yolo:
+                logger.info(f"Running YOLO animal detection for {camera.name}")
+                yolo_results = await self.run_yolo_detection(image_data)
+                animals_detected = yolo_results.get("total_animals", 0) > 0
                 
-                # Check if species identification found any foes
-                for species_data in species_results.get("species_identifications", []):
-                    species_result = species_data.get("species_result", {})
-                    for identification in species_result.get("identifications", []):
-                        if identification.get("foe_type"):
-                            foes_detected = True
+                # Run species identification on detected animals
+                if yolo_results.get("detections") and self.species_detector:
+                    logger.info(f"Running species identification for {len(yolo_results['detections'])} detected animals in {camera.name}")
+                    species_results = await self.run_species_identification(image_data, yolo_results)
+                    total_ai_cost += species_results.get("total_cost", 0.0)
+                    
+                    # Check if species identification found any foes
+                    for species_data in species_results.get("species_identifications", []):
+                        species_result = species_data.get("species_result", {})
+                        for identification in species_result.get("identifications", []):
+                            if identification.get("foe_type"):
+                                foes_detected = True
+                                break
+                        if foes_detected:
                             break
+                    
                     if foes_detected:
-                        break
-                
-                if foes_detected:
-                    logger.info(f"Species identification found foes in {camera.name}")
+                        logger.info(f"Species identification found foes in {camera.name}")
+                    elif animals_detected:
+                        logger.info(f"YOLO found {yolo_results.get('total_animals', 0)} animals in {camera.name}, but no foes identified by species detector")
                 elif animals_detected:
-                    logger.info(f"YOLO found {yolo_results.get('total_animals', 0)} animals in {camera.name}, but no foes identified by species detector")
-            elif animals_detected:
-                logger.info(f"YOLO found {yolo_results.get('total_animals', 0)} animals in {camera.name}, but no species detector available")
-            else:
-                logger.info(f"YOLO found no animals in {camera.name}")
+                    logger.info(f"YOLO found {yolo_results.get('total_animals', 0)} animals in {camera.name}, but no species detector available")
+                else:
+                    logger.info(f"YOLO found no animals in {camera.name}")
+        except BaseException:
+            # Collect the snapshot write so its errors aren't left unobserved,
+            # and don't leave the file behind for a snapshot that won't be kept
+            try:
+                os.remove(await save_task)
+            except Exception:
+                pass
+            raise
+        
+        image_path = await save_task
         
         # Determine if we should save this snapshot based on capture level and what we found
         should_save_snapshot = False
@@ -11,6 +11,8 @@ import litellm
 from pydantic import BaseModel
 
 from app.core.config import config
+from app.services.species_config import SPECIES_PROMPT, JSON_OBJECT_RE
+from app.utils.image_utils import crop_image_with_min_size
 
 logger = logging.getLogger(__name__)
 
@@ -74,79 +76,10 @@ class LiteLLMSpeciesDetector:
         Returns:
             Cropped PIL Image
         """
-        x1, y1, x2, y2 = bbox
-        
-        # Calculate bbox dimensions
-        bbox_width = x2 - x1
-        bbox_height = y2 - y1
-        
-        # Use 50% padding like other detectors for consistency
-        padding_x = bbox_width * padding_percent
-        padding_y = bbox_height * padding_percent
-        
-        # Calculate initial crop with padding
-        crop_x1 = x1 - padding_x
-        crop_y1 = y1 - padding_y
-        crop_x2 = x2 + padding_x
-        crop_y2 = y2 + padding_y
-        
-        # Calculate current crop dimensions
-        crop_width = crop_x2 - crop_x1
-        crop_height = crop_y2 - crop_y1
-        
-        # Enforce minimum size from config (default 224px)
         if min_size is None:
             min_size = config.SPECIES_MIN_CROP_SIZE
         
-        if crop_width < min_size:
-            # Expand width to minimum
-            width_deficit = min_size - crop_width
-            expand_x = width_deficit / 2
-            crop_x1 -= expand_x
-            crop_x2 += expand_x
-            crop_width = min_size
-        
-        if crop_height < min_size:
-            # Expand height to minimum
-            height_deficit = min_size - crop_height
-            expand_y = height_deficit / 2
-            crop_y1 -= expand_y
-            crop_y2 += expand_y
-            crop_height = min_size
-        
-        # Same boundary logic as other detectors
-        if crop_width > image.width:
-            crop_x1 = 0
-            crop_x2 = image.width
-        else:
-            if crop_x1 < 0:
-                crop_x2 -= crop_x1
-                crop_x1 = 0
-            if crop_x2 > image.width:
-                crop_x1 -= (crop_x2 - image.width)
-                crop_x2 = image.width
-                crop_x1 = max(0, crop_x1)
-        
-        if crop_height > image.height:
-            crop_y1 = 0
-            crop_y2 = image.height
-        else:
-            if crop_y1 < 0:
-                crop_y2 -= crop_y1
-                crop_y1 = 0
-            if crop_y2 > image.height:
-                crop_y1 -= (crop_y2 - image.height)
-                crop_y2 = image.height
-                crop_y1 = max(0, crop_y1)
-        
-        # Final boundary check
-        crop_x1 = max(0, crop_x1)
-        crop_y1 = max(0, crop_y1)
-        crop_x2 = min(image.width, crop_x2)
-        crop_y2 = min(image.height, crop_y2)
-        
-        # Crop and return the image
-        return image.crop((crop_x1, crop_y1, crop_x2, crop_y2))
+        return crop_image_with_min_size(image, bbox, padding_percent, min_size)
 
     async def identify_species(self, image: Image.Image, bbox: Tuple[int, int, int, int]) -> SpeciesDetectionResult:
         """
@@ -173,29 +106,6 @@ class LiteLLMSpeciesDetector:
             # Log image size for debugging
             logger.debug(f"Sending image to {self.provider_name}: size={len(img_base64)} chars, crop_size={cropped.width}x{cropped.height}")
             
-            # Prepare the prompt
-            prompt = """You are a wildlife expert analyzing a security camera image of an animal. 
-
-Identify the animal species and provide a structured response in JSON format:
-{
-  "identifications": [
-    {
-      "species": "specific species name (e.g., 'Norway Rat', 'House Cat', 'European Magpie')",
-      "foe_type": "category if it's a pest/foe: RATS, CROWS, CATS, HERONS, PIGEONS, or null if friendly",
-      "confidence": 0.0-1.0,
-      "description": "brief description of identifying features"
-    }
-  ]
-}
-
-Focus on:
-1. Specific species identification (not just general categories)
-2. Distinguishing features visible in the image
-3. Whether this animal is typically considered a pest/foe in gardens and farms
-4. Be precise - if unsure, indicate lower confidence
-
-Respond ONLY with valid JSON."""
-
             # Call LiteLLM API
             messages = [
                 {
@@ -203,7 +113,7 @@ Respond ONLY with valid JSON."""
                     "content": [
                         {
                             "type": "text",
-                            "text": prompt
+                            "text": SPECIES_PROMPT
                         },
                         {
                             "type": "image_url",
@@ -261,8 +171,7 @@ Respond ONLY with valid JSON."""
             # Parse JSON response
             try:
                 # Find JSON in the response
-                import re
-                json_match = re.search(r'\{.*\}', raw_response, re.DOTALL)
+                json_match = JSON_OBJECT_RE.search(raw_response)
                 if json_match:
                     json_str = json_match.group()
                     parsed = json.loads(json_str)
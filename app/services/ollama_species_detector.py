@@ -3,6 +3,7 @@
 import base64
 import json
 import logging
+import time
 from typing import Optional, Tuple, List
 from PIL import Image
 import io
@@ -10,6 +11,8 @@ import httpx
 from pydantic import BaseModel
 
 from app.core.config import config
+from app.services.species_config import SPECIES_PROMPT, JSON_OBJECT_RE
+from app.utils.image_utils import crop_image_with_min_size
 
 logger = logging.getLogger(__name__)
 
@@ -82,79 +85,10 @@ class OllamaSpeciesDetector:
         Returns:
             Cropped PIL Image
         """
-        x1, y1, x2, y2 = bbox
-        
-        # Calculate bbox dimensions
-        bbox_width = x2 - x1
-        bbox_height = y2 - y1
-        
-        # Use 50% padding like identify_species method
-        padding_x = bbox_width * padding_percent
-        padding_y = bbox_height * padding_percent
-        
-        # Calculate initial crop with padding
-        crop_x1 = x1 - padding_x
-        crop_y1 = y1 - padding_y
-        crop_x2 = x2 + padding_x
-        crop_y2 = y2 + padding_y
-        
-        # Calculate current crop dimensions
-        crop_width = crop_x2 - crop_x1
-        crop_height = crop_y2 - crop_y1
-        
-        # Enforce minimum size from config (default 224px)
         if min_size is None:
             min_size = config.SPECIES_MIN_CROP_SIZE
         
-        if crop_width < min_size:
-            # Expand width to minimum
-            width_deficit = min_size - crop_width
-            expand_x = width_deficit / 2
-            crop_x1 -= expand_x
-            crop_x2 += expand_x
-            crop_width = min_size
-        
-        if crop_height < min_size:
-            # Expand height to minimum
-            height_deficit = min_size - crop_height
-            expand_y = height_deficit / 2
-            crop_y1 -= expand_y
-            crop_y2 += expand_y
-            crop_height = min_size
-        
-        # Same boundary logic as identify_species method
-        if crop_width > image.width:
-            crop_x1 = 0
-            crop_x2 = image.width
-        else:
-            if crop_x1 < 0:
-                crop_x2 -= crop_x1
-                crop_x1 = 0
-            if crop_x2 > image.width:
-                crop_x1 -= (crop_x2 - image.width)
-                crop_x2 = image.width
-                crop_x1 = max(0, crop_x1)
-        
-        if crop_height > image.height:
-            crop_y1 = 0
-            crop_y2 = image.height
-        else:
-            if crop_y1 < 0:
-                crop_y2 -= crop_y1
-                crop_y1 = 0
-            if crop_y2 > image.height:
-                crop_y1 -= (crop_y2 - image.height)
-                crop_y2 = image.height
-                crop_y1 = max(0, crop_y1)
-        
-        # Final boundary check
-        crop_x1 = max(0, crop_x1)
-        crop_y1 = max(0, crop_y1)
-        crop_x2 = min(image.width, crop_x2)
-        crop_y2 = min(image.height, crop_y2)
-        
-        # Crop and return the image
-        return image.crop((crop_x1, crop_y1, crop_x2, crop_y2))
+        return crop_image_with_min_size(image, bbox, padding_percent, min_size)
 
     async def identify_species(self, image: Image.Image, bbox: Tuple[int, int, int, int]) -> SpeciesDetectionResult:
         """
@@ -169,146 +103,91 @@ class OllamaSpeciesDetector:
         """
         try:
             # Crop and prepare image with minimum size enforcement
-            x1, y1, x2, y2 = bbox
+            cropped = self.crop_image_with_padding(image, bbox)
             
-            # Calculate bbox dimensions
-            bbox_width = x2 - x1
-            bbox_height = y2 - y1
-            
-            # Use 50% padding like Qwen detector for consistency
-            padding_percent = 0.5
-            padding_x = bbox_width * padding_percent
-            padding_y = bbox_height * padding_percent
-            
-            # Calculate initial crop with padding
-            crop_x1 = x1 - padding_x
-            crop_y1 = y1 - padding_y
-            crop_x2 = x2 + padding_x
-            crop_y2 = y2 + padding_y
-            
-            # Calculate current crop dimensions
-            crop_width = crop_x2 - crop_x1
-            crop_height = crop_y2 - crop_y1
-            
-            # Enforce minimum size from config (default 224px)
-            min_size = config.SPECIES_MIN_CROP_SIZE
-            
-            if crop_width < min_size:
-                # Expand width to minimum
-                width_deficit = min_size - crop_width
-                expand_x = width_deficit / 2
-                crop_x1 -= expand_x
-                crop_x2 += expand_x
-                crop_width = min_size
-            
-            if crop_height < min_size:
-                # Expand height to minimum
-                height_deficit = min_size - crop_height
-                expand_y = height_deficit / 2
-                crop_y1 -= expand_y
-                crop_y2 += expand_y
-                crop_height = min_size
-            
-            # Ensure crop stays within image bounds
-            if crop_width > image.width:
-                crop_x1 = 0
-                crop_x2 = image.width
-            else:
-                if crop_x1 < 0:
-                    crop_x2 -= crop_x1
-                    crop_x1 = 0
-                if crop_x2 > image.width:
-                    crop_x1 -= (crop_x2 - image.width)
-                    crop_x2 = image.width
-                    crop_x1 = max(0, crop_x1)
-            
-            if crop_height > image.height:
-                crop_y1 = 0
-                crop_y2 = image.height
-            else:
-                if crop_y1 < 0:
-                    crop_y2 -= crop_y1
-                    crop_y1 = 0
-                if crop_y2 > image.height:
-                    crop_y1 -= (crop_y2 - image.height)
-                    crop_y2 = image.height
-                    crop_y1 = max(0, crop_y1)
-            
-            # Final boundary check
-            crop_x1 = max(0, crop_x1)
-            crop_y1 = max(0, crop_y1)
-            crop_x2 = min(image.width, crop_x2)
-            crop_y2 = min(image.height, crop_y2)
-            
-            # Crop the image
-            cropped = image.crop((crop_x1, crop_y1, crop_x2, crop_y2))
-            
-            logger.debug(f"Cropped for Ollama: bbox {bbox} (size: {bbox_width:.0f}x{bbox_height:.0f}) "
-                        f"to ({crop_x1:.0f}, {crop_y1:.0f}, {crop_x2:.0f}, {crop_y2:.0f}), "
-                        f"final size: {cropped.width}x{cropped.height} (min: {min_size}px)")
+            logger.debug(f"Cropped for Ollama: bbox {bbox} to final size: {cropped.width}x{cropped.height}")
             
             # Convert to base64
             buffered = io.BytesIO()
             cropped.save(buffered, format="JPEG", quality=85)
             img_base64 = base64.b64encode(buffered.getvalue()).decode()
             
-            # Prepare the prompt
-            prompt = """You are a wildlife expert analyzing a security camera image of an animal. 
-
-Identify the animal species and provide a structured response in JSON format:
-{
-  "identifications": [
-    {
-      "species": "specific species name (e.g., 'Norway Rat', 'House Cat', 'European Magpie')",
-      "foe_type": "category if it's a pest/foe: RATS, CROWS, CATS, HERONS, PIGEONS, or null if friendly",
-      "confidence": 0.0-1.0,
-      "description": "brief description of identifying features"
-    }
-  ]
-}
-
-Focus on:
-1. Specific species identification (not just general categories)
-2. Distinguishing features visible in the image
-3. Whether this animal is typically considered a pest/foe in gardens and farms
-4. Be precise - if unsure, indicate lower confidence
-
-Respond ONLY with valid JSON."""
-
-            # Call Ollama API
-            response = await self.client.post(
+            # Call Ollama API, streaming tokens so time-to-first-token is visible
+            # and the read timeout applies per chunk rather than to the whole answer
+            request_start = time.perf_counter()
+            first_token_s = None
+            chunks = []
+            eval_count = 0
+            eval_duration_ns = 0
+            
+            async with self.client.stream(
+                "POST",
                 f"{self.ollama_host}/api/generate",
                 json={
                     "model": self.model,
-                    "prompt": prompt,
+                    "prompt": SPECIES_PROMPT,
                     "images": [img_base64],
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": 0.1,  # Low temperature for consistent results
                         "top_p": 0.9,
                         "seed": 42  # For reproducibility
                     }
                 }
-            )
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    error_msg = f"Ollama API error: {response.status_code} - {response.text}"
+                    logger.error(error_msg)
+                    return SpeciesDetectionResult(
+                        identifications=[],
+                        raw_response="",
+                        error=error_msg
+                    )
+                
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        error_msg = f"Malformed Ollama stream chunk: {e}"
+                        logger.error(f"{error_msg}: {line[:200]}")
+                        return SpeciesDetectionResult(
+                            identifications=[],
+                            raw_response="".join(chunks),
+                            error=error_msg
+                        )
+                    
+                    # Failures after the stream started arrive as an error chunk
+                    if chunk.get("error"):
+                        error_msg = f"Ollama API error: {chunk['error']}"
+                        logger.error(error_msg)
+                        return SpeciesDetectionResult(
+                            identifications=[],
+                            raw_response="".join(chunks),
+                            error=error_msg
+                        )
+                    
+                    if chunk.get("response"):
+                        if first_token_s is None:
+                            first_token_s = time.perf_counter() - request_start
+                        chunks.append(chunk["response"])
+                    if chunk.get("done"):
+                        eval_count = chunk.get("eval_count", 0)
+                        eval_duration_ns = chunk.get("eval_duration", 0)
             
-            if response.status_code != 200:
-                error_msg = f"Ollama API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return SpeciesDetectionResult(
-                    identifications=[],
-                    raw_response="",
-                    error=error_msg
-                )
+            raw_response = "".join(chunks)
             
-            # Parse response
-            result = response.json()
-            raw_response = result.get("response", "")
+            tokens_per_s = eval_count / (eval_duration_ns / 1e9) if eval_duration_ns else 0.0
+            logger.debug(f"Ollama {self.model}: TTFT {first_token_s or 0:.2f}s, "
+                         f"total {time.perf_counter() - request_start:.2f}s, "
+                         f"{eval_count} tokens at {tokens_per_s:.1f} tok/s")
             
             # Extract JSON from response
             try:
                 # Find JSON in the response
-                import re
-                json_match = re.search(r'\{.*\}', raw_response, re.DOTALL)
+                json_match = JSON_OBJECT_RE.search(raw_response)
                 if json_match:
                     json_str = json_match.group()
                     parsed = json.loads(json_str)
@@ -14,6 +14,7 @@ from sqlmodel import Session
 
 from app.core.config import config
 from app.services.settings_service import SettingsService
+from app.utils.image_utils import crop_image_with_min_size
 
 logger = logging.getLogger(__name__)
 
@@ -86,28 +87,58 @@ class QwenSpeciesDetector:
             logger.info(f"Loading Qwen2.5-VL-3B model on {self.device}...")
             
             # Load tokenizer and processor
+            # Keep weights under the data volume so restarts reuse the download
+            cache_dir = str(config.HF_CACHE_DIR)
+            
             self.tokenizer = AutoTokenizer.from_pretrained(
                 self.model_name,
+                cache_dir=cache_dir,
                 trust_remote_code=True
             )
             
             self.processor = AutoProcessor.from_pretrained(
                 self.model_name,
+                cache_dir=cache_dir,
                 trust_remote_code=True
             )
             
             # Load model with appropriate settings
-            self.model = Qwen2_5_VLForConditionalGeneration.from_pretrained(
-                self.model_name,
-                torch_dtype=torch.float16 if self.device != "cpu" else torch.float32,
-                device_map=self.device if self.device != "cpu" else None,
-                trust_remote_code=True
-            )
+            model_kwargs = {
+                "torch_dtype": torch.float16 if self.device != "cpu" else torch.float32,
+                "device_map": self.device if self.device != "cpu" else None,
+                "cache_dir": cache_dir,
+                # mmap safetensors weights instead of unpickling a full copy in RAM
+                "use_safetensors": True,
+                "low_cpu_mem_usage": True,
+                "trust_remote_code": True
+            }
+            try:
+                # Route attention through fused scaled_dot_product_attention kernels
+                self.model = Qwen2_5_VLForConditionalGeneration.from_pretrained(
+                    self.model_name,
+                    attn_implementation="sdpa",
+                    **model_kwargs
+                )
+            except (TypeError, ValueError) as e:
+                logger.warning(f"SDPA attention not supported ({e}), using default attention")
+                self.model = Qwen2_5_VLForConditionalGeneration.from_pretrained(
+                    self.model_name,
+                    **model_kwargs
+                )
             
             if self.device == "cpu":
                 self.model = self.model.to(self.device)
             
             self.model.eval()
+            
+            if config.SPECIES_TORCH_COMPILE and hasattr(torch, "compile"):
+                # Opt-in: the first generate() pays the compilation cost
+                try:
+                    self.model.forward = torch.compile(self.model.forward)
+                    logger.info("Qwen2.5-VL forward pass compiled with torch.compile")
+                except Exception as e:
+                    logger.warning(f"torch.compile failed, using eager mode: {e}")
+            
             self.model_loaded = True
             
             logger.info("Qwen2.5-VL-3B model loaded successfully")
@@ -130,84 +161,9 @@ class QwenSpeciesDetector:
         Returns:
             Cropped PIL Image with padding and minimum size guarantee
         """
-        x1, y1, x2, y2 = bbox
-        
-        # Calculate bbox dimensions
-        bbox_width = x2 - x1
-        bbox_height = y2 - y1
-        
-        # Calculate padding based on bbox size
-        padding_x = bbox_width * padding_percent
-        padding_y = bbox_height * padding_percent
-        
-        # Calculate initial crop coordinates with padding
-        crop_x1 = x1 - padding_x
-        crop_y1 = y1 - padding_y
-        crop_x2 = x2 + padding_x
-        crop_y2 = y2 + padding_y
-        
-        # Calculate current crop dimensions
-        crop_width = crop_x2 - crop_x1
-        crop_height = crop_y2 - crop_y1
-        
-        # Enforce minimum size if needed
-        if crop_width < min_size:
-            # Need to expand width
-            width_deficit = min_size - crop_width
-            expand_x = width_deficit / 2
-            crop_x1 -= expand_x
-            crop_x2 += expand_x
-            crop_width = min_size
-            logger.debug(f"Expanded crop width from {crop_width:.0f} to {min_size}px")
-        
-        if crop_height < min_size:
-            # Need to expand height
-            height_deficit = min_size - crop_height
-            expand_y = height_deficit / 2
-            crop_y1 -= expand_y
-            crop_y2 += expand_y
-            crop_height = min_size
-            logger.debug(f"Expanded crop height from {crop_height:.0f} to {min_size}px")
-        
-        # Ensure crop stays within image bounds
-        # If crop is larger than image dimension, center it
-        if crop_width > image.width:
-            crop_x1 = 0
-            crop_x2 = image.width
-        else:
-            # Adjust if crop extends beyond image bounds
-            if crop_x1 < 0:
-                crop_x2 -= crop_x1  # Shift right by the amount we're negative
-                crop_x1 = 0
-            if crop_x2 > image.width:
-                crop_x1 -= (crop_x2 - image.width)  # Shift left by the overflow
-                crop_x2 = image.width
-                crop_x1 = max(0, crop_x1)  # Ensure we don't go negative
-        
-        if crop_height > image.height:
-            crop_y1 = 0
-            crop_y2 = image.height
-        else:
-            # Adjust if crop extends beyond image bounds
-            if crop_y1 < 0:
-                crop_y2 -= crop_y1  # Shift down by the amount we're negative
-                crop_y1 = 0
-            if crop_y2 > image.height:
-                crop_y1 -= (crop_y2 - image.height)  # Shift up by the overflow
-                crop_y2 = image.height
-                crop_y1 = max(0, crop_y1)  # Ensure we don't go negative
-        
-        # Final boundary check
-        crop_x1 = max(0, crop_x1)
-        crop_y1 = max(0, crop_y1)
-        crop_x2 = min(image.width, crop_x2)
-        crop_y2 = min(image.height, crop_y2)
-        
-        # Crop the image
-        cropped = image.crop((crop_x1, crop_y1, crop_x2, crop_y2))
+        cropped = crop_image_with_min_size(image, bbox, padding_percent, min_size)
         
-        logger.debug(f"Cropped image from bbox {bbox} (size: {bbox_width:.0f}x{bbox_height:.0f}) with "
-                    f"{padding_percent*100}% padding to ({crop_x1:.1f}, {crop_y1:.1f}, {crop_x2:.1f}, {crop_y2:.1f}), "
+        logger.debug(f"Cropped image from bbox {bbox} with {padding_percent*100}% padding, "
                     f"final size: {cropped.width}x{cropped.height} (min: {min_size}px)")
         
         return cropped
@@ -315,7 +271,8 @@ Be precise with species names. Focus on visible anatomical features, coloring, a
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
             # Generate response
-            with torch.no_grad():
+            # inference_mode also skips autograd version counters and view tracking
+            with torch.inference_mode():
                 generated_ids = self.model.generate(
                     **inputs,
                     max_new_tokens=self.max_tokens,
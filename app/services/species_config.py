@@ -3,6 +3,7 @@
 This module defines how YOLO-detected animals are classified as foes or friends.
 """
 
+import re
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
@@ -180,4 +181,31 @@ class SpeciesClassifier:
         """Get recommended deterrent sounds for a foe type."""
         if foe_type in self.behaviors:
             return self.behaviors[foe_type]["deterrent_sounds"]
-        return []
\ No newline at end of file
+        return []
+
+
+# Prompt shared by the vision model species detectors (Ollama, LiteLLM);
+# built once at import instead of on every identification call
+SPECIES_PROMPT = """You are a wildlife expert analyzing a security camera image of an animal. 
+
+Identify the animal species and provide a structured response in JSON format:
+{
+  "identifications": [
+    {
+      "species": "specific species name (e.g., 'Norway Rat', 'House Cat', 'European Magpie')",
+      "foe_type": "category if it's a pest/foe: RATS, CROWS, CATS, HERONS, PIGEONS, or null if friendly",
+      "confidence": 0.0-1.0,
+      "description": "brief description of identifying features"
+    }
+  ]
+}
+
+Focus on:
+1. Specific species identification (not just general categories)
+2. Distinguishing features visible in the image
+3. Whether this animal is typically considered a pest/foe in gardens and farms
+4. Be precise - if unsure, indicate lower confidence
+
+Respond ONLY with valid JSON."""
+
+JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
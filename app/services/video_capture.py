@@ -20,6 +20,7 @@ class VideoCapture:
         """Initialize the video capture service."""
         self.video_dir = Path("data/videos")
         self.video_dir.mkdir(parents=True, exist_ok=True)
+        self._ffmpeg_available: Optional[bool] = None
         
     async def capture_video(
         self, 
@@ -93,23 +94,30 @@ class VideoCapture:
                 
         except FileNotFoundError:
             logger.error("FFmpeg not found. Please install ffmpeg to enable video capture.")
+            self._ffmpeg_available = False
             return None
         except Exception as e:
             logger.error(f"Error capturing video: {e}")
             return None
     
     def check_ffmpeg_available(self) -> bool:
-        """Check if ffmpeg is available on the system."""
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if ffmpeg is available on the system.
+        
+        The result is cached: spawning ``ffmpeg -version`` on every detection
+        costs a process start right when video capture should begin.
+        """
+        if self._ffmpeg_available is None:
+            try:
+                result = subprocess.run(
+                    ["ffmpeg", "-version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                self._ffmpeg_available = result.returncode == 0
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                self._ffmpeg_available = False
+        return self._ffmpeg_available
     
     def get_rtsp_url(self, camera_metadata: dict) -> Optional[str]:
         """
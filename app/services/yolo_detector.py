@@ -1,24 +1,37 @@
 """YOLOv11 Detection Service for multi-species animal detection."""
 
+import asyncio
 import logging
+import os
+import shutil
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union
 import numpy as np
 from PIL import Image
+
+# The app sets this in app.main before anything imports torch; this only
+# covers scripts that use the service directly and import it first
+os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
+
 import torch
 from ultralytics import YOLO
 from dataclasses import dataclass
 import time
 import psutil
-import os
 
 from app.services.species_config import SpeciesClassifier, COCO_CLASSES
 from app.core.config import config
 
 logger = logging.getLogger(__name__)
 
+# COCO classes YOLO reports that we treat as animals, by category
+AVIAN_CLASSES = frozenset({"bird"})
+MAMMAL_CLASSES = frozenset({"cat", "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe"})
+ANIMAL_CATEGORIES = frozenset({"avian", "mammal", "reptile", "amphibian"})
 
-@dataclass
+
+@dataclass(slots=True)
 class YOLODetection:
     """Represents a single YOLO detection result."""
     class_id: int
@@ -45,8 +58,20 @@ class YOLOv11DetectionService:
             self.model_path = str(config.MODELS_DIR / config.YOLO_MODEL_NAME)
             
         self.device = device or self._select_device()
+        self.half = False
         self.model = None
         self.species_classifier = SpeciesClassifier()
+        
+        # The model and its predictor aren't thread-safe; every caller of
+        # this shared service goes through one forward pass at a time
+        self._inference_lock = threading.Lock()
+        
+        # Images waiting to be run through YOLO together as one batch
+        self._pending: List[Tuple[np.ndarray, float, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_running = False
+        self._batch_tasks = set()
+        
         self._load_model()
         
     def _select_device(self) -> str:
@@ -68,17 +93,43 @@ class YOLOv11DetectionService:
                 logger.info(f"YOLOv11 model not found at {self.model_path}, will download automatically")
                 # Ensure parent directory exists
                 model_file.parent.mkdir(parents=True, exist_ok=True)
+                self._download_model(model_file)
             
             logger.info(f"Loading YOLOv11 model from {self.model_path} on device {self.device}")
             
             # YOLO will automatically download the model if it doesn't exist
             self.model = YOLO(self.model_path)
-            self.model.to(self.device)
+            
+            export_format = self._resolve_export_format()
+            exported_model = self._load_exported_model(export_format) if export_format else None
+            if exported_model is not None:
+                # Exported runtimes manage their own device and precision
+                self.model = exported_model
+                self.half = False
+            else:
+                self.model.to(self.device)
+                self._verify_device()
+                
+                self.half = self._use_half_precision()
+            
+            if self.device == "cuda":
+                # Camera frames share one resolution, so letterboxed input
+                # shapes are stable and cuDNN can autotune kernels once
+                torch.backends.cudnn.benchmark = True
+            
+            # The predictor fixes its backend's precision when it is built,
+            # so build it only now that self.half is decided
+            self.model.predictor = None
+            
+            if exported_model is None and config.YOLO_TORCH_COMPILE:
+                self._compile_model()
+            
+            self._warmup()
             
             # Verify model loaded correctly by checking model info
             if hasattr(self.model, 'model') and self.model.model is not None:
                 logger.info(f"YOLOv11 model loaded successfully on {self.device}")
-                logger.info(f"Model has {len(self.model.model.names)} classes")
+                logger.info(f"Model has {len(self.model.names)} classes")
             else:
                 raise RuntimeError("Model loaded but appears to be invalid")
                 
@@ -86,6 +137,195 @@ class YOLOv11DetectionService:
             logger.error(f"Failed to load YOLO model: {e}")
             raise
     
+    def _compile_model(self):
+        """Compile the detection network with torch.compile (opt-in).
+        
+        TorchDynamo traces the fixed-shape forward once and Inductor emits
+        fused kernels, removing per-op Python dispatch from every snapshot.
+        The network is compiled inside the predictor's backend, which is
+        what every inference call runs; the backend fuses and casts its own
+        module when it is built, so compiling YOLO.model would be bypassed.
+        Compilation happens on the first forward pass; if that fails the
+        eager module is restored.
+        """
+        if not hasattr(torch, "compile"):
+            return
+        
+        # On CUDA, "reduce-overhead" records the fixed-shape forward into a
+        # CUDA graph and replays it; PyTorch has no public MPS equivalent
+        mode = "reduce-overhead" if self.device == "cuda" else "default"
+        
+        dummy = np.zeros((640, 640, 3), dtype=np.uint8)
+        if self.model.predictor is None:
+            # Build the predictor (and its backend) in the final precision
+            self.model(dummy, half=self.half, verbose=False)
+        
+        backend = self.model.predictor.model
+        eager_module = backend.model
+        try:
+            backend.model = torch.compile(eager_module, mode=mode, dynamic=False)
+            # Trace and compile now, so a failure is caught here
+            self.model(dummy, half=self.half, verbose=False)
+            logger.info("YOLO model compiled with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed for YOLO, using eager mode: {e}")
+            backend.model = eager_module
+    
+    def _use_half_precision(self) -> bool:
+        """Decide whether to run inference in FP16.
+        
+        FP16 halves activation bandwidth and uses the faster half-precision
+        ALUs. "auto" enables it on CUDA only; "true" also enables it on MPS,
+        where it is usually faster but less battle-tested.
+        """
+        setting = config.YOLO_HALF_PRECISION.lower()
+        if self.device == "cpu" or setting == "false":
+            return False
+        if setting == "true":
+            return True
+        return self.device == "cuda"
+    
+    def _warmup(self, iterations: int = 2):
+        """Run dummy forward passes so the first real snapshot is not slow.
+        
+        The first inference pays for predictor setup, kernel selection
+        (cuDNN autotuning) and Metal shader compilation. Doing it at load
+        time keeps that cost out of the detection loop and its timing logs.
+        """
+        dummy = np.zeros((640, 640, 3), dtype=np.uint8)
+        try:
+            for _ in range(iterations):
+                self.model(dummy, half=self.half, verbose=False)
+        except Exception as e:
+            logger.warning(f"YOLO warmup failed: {e}")
+    
+    def _synchronize(self):
+        """Wait for queued GPU work so timings measure completed inference."""
+        if self.device == "cuda":
+            torch.cuda.synchronize()
+        elif self.device == "mps":
+            torch.mps.synchronize()
+    
+    def _exported_model_path(self, export_format: str, int8: bool = False) -> Path:
+        """Return where an export of the loaded weights is kept."""
+        weights = Path(self.model_path)
+        stem = weights.stem + ("_int8" if int8 else "")
+        if export_format == "engine":
+            # TensorRT engines are built for a maximum batch size
+            stem += f"_b{config.YOLO_MAX_BATCH_SIZE}"
+        suffixes = {
+            "onnx": ".onnx",
+            "coreml": ".mlpackage",
+            "engine": ".engine",
+            "openvino": "_openvino_model",
+            "torchscript": ".torchscript",
+        }
+        return weights.with_name(stem + suffixes.get(export_format, f".{export_format}"))
+    
+    def _resolve_export_format(self) -> str:
+        """Return the export format to run, resolving "auto" for this device.
+        
+        On CUDA "auto" selects a TensorRT engine, which runs fused FP16
+        kernels on the tensor cores. On Apple Silicon it selects CoreML,
+        which schedules the network on the Neural Engine/GPU without
+        PyTorch's per-op MPS dispatch. Elsewhere it keeps the PyTorch model.
+        """
+        export_format = config.YOLO_EXPORT_FORMAT.strip().lower()
+        if export_format == "auto":
+            return {"cuda": "engine", "mps": "coreml"}.get(self.device, "")
+        return export_format
+    
+    def _export_options(self, export_format: str, int8: bool) -> Dict[str, Any]:
+        """Return format-specific ultralytics export arguments."""
+        if export_format != "engine":
+            return {}
+        # Dynamic shapes up to the batch size the detection processor sends,
+        # FP16 unless quantizing, and up to 4 GiB of builder workspace
+        return {
+            "half": not int8,
+            "dynamic": True,
+            "batch": config.YOLO_MAX_BATCH_SIZE,
+            "workspace": 4,
+        }
+    
+    def _load_exported_model(self, export_format: str) -> Optional[YOLO]:
+        """Export the PyTorch weights once and load the exported model.
+        
+        Runtimes like TensorRT, CoreML (Apple Neural Engine) or ONNX Runtime
+        run an ahead-of-time compiled graph instead of eager PyTorch. The export is
+        written next to the .pt file and reused on later starts. With
+        YOLO_EXPORT_INT8 the export is post-training quantized to int8,
+        calibrated on ultralytics' sample dataset.
+        
+        Args:
+            export_format: ultralytics export format, e.g. "engine", "coreml" or "onnx"
+            
+        Returns:
+            Exported YOLO model, or None to keep using the PyTorch model
+        """
+        int8 = config.YOLO_EXPORT_INT8
+        exported_path = self._exported_model_path(export_format, int8)
+        
+        try:
+            if not exported_path.exists():
+                precision = "int8" if int8 else "full precision"
+                logger.info(f"Exporting YOLO model to {export_format}, {precision} (one-time)")
+                written = Path(self.model.export(
+                    format=export_format,
+                    imgsz=640,
+                    int8=int8,
+                    verbose=False,
+                    **self._export_options(export_format, int8)
+                ))
+                if written != exported_path:
+                    # Keep exports of the same format with different settings apart
+                    shutil.move(str(written), str(exported_path))
+            
+            logger.info(f"Loading exported YOLO model from {exported_path}")
+            return YOLO(str(exported_path), task="detect")
+            
+        except Exception as e:
+            logger.warning(f"YOLO {export_format} export unavailable ({e}), using PyTorch model")
+            return None
+    
+    def _download_model(self, model_file: Path):
+        """Fetch the configured model weights with a resumable download.
+        
+        Interrupted downloads continue where they stopped on the next start.
+        If the download fails, ultralytics' own downloader is used instead.
+        """
+        if model_file.name != config.YOLO_MODEL_NAME or not config.YOLO_MODEL_URL:
+            return
+        
+        from app.utils.download import download_file_resumable
+        
+        try:
+            download_file_resumable(config.YOLO_MODEL_URL, model_file)
+        except Exception as e:
+            logger.warning(f"Resumable model download failed ({e}), falling back to ultralytics download")
+    
+    def _verify_device(self):
+        """Probe the selected accelerator once and pin CPU if it fails.
+        
+        Some MPS/CUDA setups load the model fine but fail on the first
+        forward pass. Checking once at load time keeps that failure out of
+        the per-image inference path.
+        """
+        if self.device == "cpu":
+            return
+        
+        try:
+            probe = np.zeros((64, 64, 3), dtype=np.uint8)
+            self.model(probe, verbose=False)
+        except Exception as e:
+            logger.warning(f"YOLO inference failed on {self.device} ({e}), falling back to CPU")
+            self.device = "cpu"
+            self.model.to(self.device)
+        finally:
+            # The probe built a full-precision predictor around the eager
+            # module; drop it so half precision and compilation take effect
+            self.model.predictor = None
+    
     def detect_animals(self, image: Image.Image, confidence_threshold: float = 0.25) -> List[YOLODetection]:
         """Detect animals in an image using YOLO.
         
@@ -101,8 +341,7 @@ class YOLOv11DetectionService:
         all_detections = self.detect(image, confidence_threshold)
         
         # Filter to only animals
-        animal_categories = ["avian", "mammal", "reptile", "amphibian"]
-        animal_detections = [d for d in all_detections if d.category in animal_categories]
+        animal_detections = [d for d in all_detections if d.category in ANIMAL_CATEGORIES]
         
         logger.info(f"YOLO detected {len(animal_detections)} animals out of {len(all_detections)} total objects")
         
@@ -129,42 +368,13 @@ class YOLOv11DetectionService:
         
         try:
             # Run inference
-            results = self.model(image, conf=confidence_threshold, verbose=False)
+            with self._inference_lock:
+                results = self.model(image, conf=confidence_threshold, half=self.half, verbose=False)
+                self._synchronize()
             
             detections = []
             for r in results:
-                if r.boxes is not None:
-                    for box in r.boxes:
-                        class_id = int(box.cls)
-                        
-                        # Get class name from COCO classes
-                        if class_id in COCO_CLASSES:
-                            class_name = COCO_CLASSES[class_id]
-                            
-                            # Get bounding box coordinates
-                            x1, y1, x2, y2 = box.xyxy[0].tolist()
-                            
-                            # Check if this is an animal we care about
-                            is_foe, foe_type, _ = self.species_classifier.classify_detection(
-                                class_name, float(box.conf), (x1, y1, x2, y2)
-                            )
-                            
-                            # Determine category
-                            if class_name in ["bird"]:
-                                category = "avian"
-                            elif class_name in ["cat", "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe"]:
-                                category = "mammal"
-                            else:
-                                continue  # Skip non-animal classes
-                            
-                            detection = YOLODetection(
-                                class_id=class_id,
-                                class_name=class_name,
-                                confidence=float(box.conf),
-                                bbox=(x1, y1, x2, y2),
-                                category=category
-                            )
-                            detections.append(detection)
+                detections.extend(self._parse_result(r))
             
             # Get memory usage after inference
             memory_after = process.memory_info().rss / 1024 / 1024  # MB
@@ -183,6 +393,179 @@ class YOLOv11DetectionService:
             logger.error(f"Error during YOLO detection: {e}")
             raise
     
+    def detect_batch(
+        self, 
+        images: List[Union[Image.Image, np.ndarray]], 
+        confidence_threshold: float = 0.25
+    ) -> List[List[YOLODetection]]:
+        """Detect objects in several images with a single model call.
+        
+        Batching amortizes per-call preprocessing and kernel launch overhead
+        compared to calling detect() once per image.
+        
+        Args:
+            images: PIL Images or BGR numpy arrays to process
+            confidence_threshold: Minimum confidence score for detections
+            
+        Returns:
+            One list of YOLODetection objects per input image, in input order
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        if not images:
+            return []
+        
+        start_time = time.time()
+        
+        try:
+            with self._inference_lock:
+                results = self.model(list(images), conf=confidence_threshold, half=self.half, verbose=False)
+                self._synchronize()
+            batch_detections = [self._parse_result(r) for r in results]
+            
+            processing_time = time.time() - start_time
+            logger.info(f"YOLO batch inference on {len(images)} images completed in {processing_time:.3f}s, "
+                       f"found {sum(len(d) for d in batch_detections)} animals")
+            
+            return batch_detections
+            
+        except Exception as e:
+            logger.error(f"Error during YOLO batch detection: {e}")
+            raise
+    
+    async def detect_queued(
+        self, 
+        image: np.ndarray, 
+        confidence_threshold: float = 0.25
+    ) -> Tuple[List[YOLODetection], int]:
+        """Detect objects in an image as part of the next batched pass.
+        
+        Images queued by concurrent callers (e.g. several cameras checked at
+        once) while a pass is running go through together in the next pass.
+        When the model is idle the image runs right away, unless
+        YOLO_BATCH_WINDOW_MS asks to wait for more images first.
+        
+        Args:
+            image: BGR numpy array to process
+            confidence_threshold: Minimum confidence score for detections
+            
+        Returns:
+            Detections for the image, and how long its batch pass took in ms
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((image, confidence_threshold, future))
+        
+        if not self._batch_running:
+            if config.YOLO_BATCH_WINDOW_MS <= 0 or len(self._pending) >= config.YOLO_MAX_BATCH_SIZE:
+                self._flush_batch()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(
+                    config.YOLO_BATCH_WINDOW_MS / 1000, self._flush_batch
+                )
+        
+        return await future
+    
+    def _flush_batch(self):
+        """Start a batched YOLO pass over the pending images.
+        
+        Only one pass runs at a time. Images queued while a pass is running
+        are not flushed as separate small batches; they wait and go through
+        together once it finishes.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        if self._batch_running or not self._pending:
+            return
+        
+        max_batch = max(1, config.YOLO_MAX_BATCH_SIZE)
+        batch = self._pending[:max_batch]
+        self._pending = self._pending[max_batch:]
+        
+        self._batch_running = True
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[np.ndarray, float, asyncio.Future]]):
+        """Run one YOLO forward pass for a batch and resolve the waiting futures."""
+        images = [image for image, _, _ in batch]
+        # One pass at the lowest threshold; each caller's own is applied below
+        threshold = min(confidence for _, confidence, _ in batch)
+        
+        start_time = time.time()
+        try:
+            # Off the event loop; _flush_batch keeps passes sequential
+            results = await asyncio.to_thread(self.detect_batch, images, threshold)
+            duration_ms = round((time.time() - start_time) * 1000)
+            # A short result list must fail every waiter, not leave some hanging
+            paired = list(zip(batch, results, strict=True))
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._batch_running = False
+            # Run whatever queued up during this pass as the next batch
+            self._flush_batch()
+        
+        for (_, confidence, future), detections in paired:
+            if not future.done():
+                future.set_result(([d for d in detections if d.confidence >= confidence], duration_ms))
+    
+    def _parse_result(self, result) -> List[YOLODetection]:
+        """Convert a single ultralytics result into animal detections.
+        
+        Args:
+            result: Ultralytics Results object for one image
+            
+        Returns:
+            List of YOLODetection objects for animal classes
+        """
+        detections = []
+        if result.boxes is None:
+            return detections
+        
+        # Copy all box tensors to the host in one transfer each instead of
+        # syncing with the device for every box attribute
+        class_ids = result.boxes.cls.cpu().tolist()
+        confidences = result.boxes.conf.cpu().tolist()
+        boxes = result.boxes.xyxy.cpu().tolist()
+        
+        for class_id, confidence, (x1, y1, x2, y2) in zip(class_ids, confidences, boxes):
+            class_id = int(class_id)
+            
+            # Get class name from COCO classes
+            if class_id in COCO_CLASSES:
+                class_name = COCO_CLASSES[class_id]
+                
+                # Check if this is an animal we care about
+                is_foe, foe_type, _ = self.species_classifier.classify_detection(
+                    class_name, confidence, (x1, y1, x2, y2)
+                )
+                
+                # Determine category
+                if class_name in AVIAN_CLASSES:
+                    category = "avian"
+                elif class_name in MAMMAL_CLASSES:
+                    category = "mammal"
+                else:
+                    continue  # Skip non-animal classes
+                
+                detection = YOLODetection(
+                    class_id=class_id,
+                    class_name=class_name,
+                    confidence=confidence,
+                    bbox=(x1, y1, x2, y2),
+                    category=category
+                )
+                detections.append(detection)
+        
+        return detections
+    
     def detect_from_path(self, image_path: str, confidence_threshold: float = 0.25) -> List[YOLODetection]:
         """Detect animals in an image from file path.
         
@@ -239,8 +622,8 @@ class YOLOv11DetectionService:
         
         return all_detections, foe_detections
     
+    @staticmethod
     def draw_detections(
-        self, 
         image: Image.Image, 
         detections: List[YOLODetection],
         foe_classifications: Optional[Dict[str, List[YOLODetection]]] = None
@@ -256,10 +639,145 @@ class YOLOv11DetectionService:
             Image with drawn bounding boxes
         """
         import cv2
-        import numpy as np
         
-        # Convert PIL to OpenCV format
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        img_cv = YOLOv11DetectionService._draw_on_array(image, detections, foe_classifications)
+        
+        # Convert back to PIL
+        img_pil = Image.fromarray(cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
+        return img_pil
+    
+    @staticmethod
+    def render_stored_detections_jpeg(image_path: Union[str, Path], yolo_results: Dict[str, Any]) -> bytes:
+        """Draw the YOLO results stored with a detection onto its image.
+        
+        Needs only the stored results, not a loaded model. Decoding, drawing
+        and encoding are CPU-bound, so async routes should run this in a
+        worker thread to keep the event loop responsive.
+        
+        Args:
+            image_path: Path to the detection image
+            yolo_results: Stored results with "detections" and optional "foe_classifications"
+            
+        Returns:
+            JPEG bytes of the image with bounding boxes
+        """
+        image = YOLOv11DetectionService.read_image_bgr(image_path)
+        detections = [
+            YOLODetection(
+                class_id=0,  # Not needed for drawing
+                class_name=det["class_name"],
+                confidence=det["confidence"],
+                bbox=tuple(det["bbox"]),
+                category=det.get("category", "unknown")
+            )
+            for det in yolo_results["detections"]
+        ]
+        
+        # Draw bounding boxes and encode in one pass
+        return YOLOv11DetectionService.draw_detections_jpeg(
+            image,
+            detections,
+            yolo_results.get("foe_classifications", {})
+        )
+    
+    @staticmethod
+    def draw_detections_jpeg(
+        image: Union[Image.Image, np.ndarray], 
+        detections: List[YOLODetection],
+        foe_classifications: Optional[Dict[str, List[YOLODetection]]] = None,
+        quality: int = 85
+    ) -> bytes:
+        """Draw bounding boxes on image and encode the result as JPEG.
+        
+        Converts to OpenCV format once and encodes straight from the drawn
+        array, skipping the round trip back through PIL. BGR arrays are
+        drawn on in place, so the caller's array is consumed.
+        
+        Args:
+            image: Original image, either PIL or a BGR array from read_image_bgr
+            detections: List of detections to draw
+            foe_classifications: Optional dict mapping foe types to detections
+            quality: JPEG quality (10-100)
+            
+        Returns:
+            JPEG bytes of the image with drawn bounding boxes
+        """
+        import cv2
+        
+        img_cv = YOLOv11DetectionService._draw_on_array(image, detections, foe_classifications)
+        
+        success, encoded = cv2.imencode(".jpg", img_cv, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not success:
+            raise RuntimeError("Failed to encode detection image as JPEG")
+        return encoded.tobytes()
+    
+    @staticmethod
+    def read_image_bgr(image_path: Union[str, Path]) -> np.ndarray:
+        """Decode an image file straight into a BGR array.
+        
+        cv2.imread goes through libjpeg-turbo, which decodes surveillance
+        JPEGs noticeably faster than PIL and skips the PIL to numpy copy.
+        
+        Args:
+            image_path: Path to the image file
+            
+        Returns:
+            BGR numpy array
+        """
+        import cv2
+        
+        img_cv = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+        if img_cv is None:
+            raise ValueError(f"Could not decode image: {image_path}")
+        return img_cv
+    
+    @staticmethod
+    def decode_image_bgr(image_data: bytes) -> np.ndarray:
+        """Decode encoded image bytes (e.g. a camera snapshot) into a BGR array.
+        
+        ultralytics consumes BGR arrays as-is, so this skips both the PIL
+        decode and the PIL to numpy conversion with RGB->BGR swap per frame.
+        
+        Args:
+            image_data: Encoded image bytes
+            
+        Returns:
+            BGR numpy array
+        """
+        import cv2
+        
+        img_cv = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if img_cv is None:
+            raise ValueError("Could not decode image data")
+        return img_cv
+    
+    @staticmethod
+    def _draw_on_array(
+        image: Union[Image.Image, np.ndarray], 
+        detections: List[YOLODetection],
+        foe_classifications: Optional[Dict[str, List[YOLODetection]]] = None
+    ) -> np.ndarray:
+        """Draw bounding boxes onto a BGR version of the image.
+        
+        PIL images are converted into a new array; BGR arrays are drawn on
+        in place without copying.
+        
+        Args:
+            image: Original image, either PIL or a BGR array
+            detections: List of detections to draw
+            foe_classifications: Optional dict mapping foe types to detections
+            
+        Returns:
+            BGR numpy array with drawn bounding boxes
+        """
+        import cv2
+        
+        if isinstance(image, np.ndarray):
+            # Already BGR (e.g. from read_image_bgr), draw in place
+            img_cv = image
+        else:
+            # Convert PIL to OpenCV format
+            img_cv = cv2.cvtColor(np.asarray(image.convert("RGB")), cv2.COLOR_RGB2BGR)
         
         # Create a mapping of detections to foe types for coloring
         detection_to_foe = {}
@@ -277,8 +795,15 @@ class YOLOv11DetectionService:
             "unknown": (128, 128, 128) # Gray for unknown
         }
         
-        for detection in detections:
-            x1, y1, x2, y2 = map(int, detection.bbox)
+        if not detections:
+            return img_cv
+        
+        # Clip all boxes to the image bounds and cast to int in one step
+        height, width = img_cv.shape[:2]
+        boxes = np.asarray([detection.bbox for detection in detections], dtype=np.float32)
+        boxes = np.clip(boxes, 0, [width - 1, height - 1, width - 1, height - 1]).astype(np.int32)
+        
+        for detection, (x1, y1, x2, y2) in zip(detections, boxes.tolist()):
             
             # Determine color based on foe classification
             foe_type = detection_to_foe.get(id(detection))
@@ -299,8 +824,33 @@ class YOLOv11DetectionService:
             
             # Draw label text
             cv2.putText(img_cv, label, (x1, y1 - 2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
         
-        # Convert back to PIL
-        img_pil = Image.fromarray(cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
-        return img_pil
\ No newline at end of file
+        return img_cv
+
+
+# Loaded services keyed by (model path, device), shared across callers
+_SERVICE_CACHE: Dict[Tuple[Optional[str], Optional[str]], YOLOv11DetectionService] = {}
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def get_yolo_service(model_path: Optional[str] = None, device: Optional[str] = None) -> YOLOv11DetectionService:
+    """Return a shared YOLO service, loading the model only on first use.
+    
+    Loading the weights, probing the device and warming up takes seconds,
+    so callers that only need inference should share one instance.
+    
+    Args:
+        model_path: Path to the YOLO model file. If None, uses default model location
+        device: Device to run inference on. Auto-selects if None
+        
+    Returns:
+        Cached YOLOv11DetectionService instance
+    """
+    key = (model_path, device)
+    with _SERVICE_CACHE_LOCK:
+        service = _SERVICE_CACHE.get(key)
+        if service is None:
+            service = YOLOv11DetectionService(model_path=model_path, device=device)
+            _SERVICE_CACHE[key] = service
+        return service
@@ -0,0 +1,72 @@
+"""Resumable file downloads for model weights."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def download_file_resumable(
+    url: str,
+    dest: Union[str, Path],
+    sha256: Optional[str] = None,
+    timeout: float = 60.0
+) -> Path:
+    """Download a file, resuming a previous partial download if present.
+
+    Data is streamed into ``<dest>.part`` and atomically renamed once
+    complete, so an interrupted download never leaves a truncated file at
+    ``dest`` and a retry only fetches the missing bytes.
+
+    Args:
+        url: URL to download
+        dest: Final file path
+        sha256: Optional expected hex digest, verified before the rename
+        timeout: Network timeout in seconds
+
+    Returns:
+        Path to the downloaded file
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+
+    existing = part.stat().st_size if part.exists() else 0
+    headers = {"Range": f"bytes={existing}-"} if existing else {}
+
+    with httpx.stream("GET", url, headers=headers, follow_redirects=True, timeout=timeout) as response:
+        if response.status_code == 416:
+            # Partial file is already complete
+            pass
+        else:
+            response.raise_for_status()
+            # Server ignored the range request: start over
+            mode = "ab" if response.status_code == 206 else "wb"
+            if existing and mode == "wb":
+                logger.info(f"Server does not support resume, restarting download of {url}")
+            elif existing:
+                logger.info(f"Resuming download of {url} at {existing} bytes")
+
+            with open(part, mode) as f:
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+
+    if sha256:
+        digest = hashlib.sha256()
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != sha256.lower():
+            part.unlink(missing_ok=True)
+            raise ValueError(f"Checksum mismatch for {url}")
+
+    os.replace(part, dest)
+    logger.info(f"Downloaded {url} to {dest}")
+    return dest
@@ -2,9 +2,11 @@
 
 import hashlib
 import os
+import shutil
 from pathlib import Path
+import numpy as np
 from PIL import Image
-from typing import Tuple, Optional
+from typing import Sequence, Tuple, Optional
 
 
 def crop_image_with_padding(image: Image.Image, bbox: Tuple[int, int, int, int], 
@@ -38,6 +40,74 @@ def crop_image_with_padding(image: Image.Image, bbox: Tuple[int, int, int, int],
     return image.crop((padded_x1, padded_y1, padded_x2, padded_y2))
 
 
+def compute_crop_boxes(bboxes: Sequence[Sequence[float]], image_size: Tuple[int, int],
+                       padding_percent: float = 0.5, min_size: int = 224) -> np.ndarray:
+    """
+    Compute padded, minimum-size crop boxes for many bounding boxes at once.
+    
+    Each box is padded by ``padding_percent`` of its size, grown symmetrically
+    to at least ``min_size`` pixels per side, shifted back inside the image
+    when it overhangs an edge and clamped to the image when it is larger
+    than the image itself.
+    
+    Args:
+        bboxes: Bounding boxes as (x1, y1, x2, y2), shape (N, 4)
+        image_size: Image (width, height)
+        padding_percent: Padding to add as percentage of bbox size (0.5 = 50%)
+        min_size: Minimum crop width/height in pixels
+        
+    Returns:
+        Float array of crop boxes with shape (N, 4)
+    """
+    boxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    limit = np.asarray(image_size, dtype=np.float64)
+    
+    # Pad relative to the bbox size
+    padding = (boxes[:, 2:] - boxes[:, :2]) * padding_percent
+    lo = boxes[:, :2] - padding
+    hi = boxes[:, 2:] + padding
+    
+    # Grow symmetrically up to the minimum size
+    size = hi - lo
+    expand = np.maximum(min_size - size, 0) / 2
+    lo -= expand
+    hi += expand
+    size = np.maximum(size, min_size)
+    
+    # Shift boxes that overhang an edge back inside the image
+    shift = np.maximum(-lo, 0)
+    lo += shift
+    hi += shift
+    overflow = np.maximum(hi - limit, 0)
+    lo -= overflow
+    hi -= overflow
+    
+    # Boxes larger than the image cover the whole axis
+    oversized = size > limit
+    lo = np.where(oversized, 0, lo)
+    hi = np.where(oversized, limit, hi)
+    
+    return np.concatenate([np.clip(lo, 0, limit), np.clip(hi, 0, limit)], axis=1)
+
+
+def crop_image_with_min_size(image: Image.Image, bbox: Tuple[float, float, float, float],
+                             padding_percent: float = 0.5, min_size: int = 224) -> Image.Image:
+    """
+    Crop an image around a bounding box with padding and a minimum crop size.
+    
+    Args:
+        image: PIL Image to crop
+        bbox: Bounding box as (x1, y1, x2, y2)
+        padding_percent: Padding to add as percentage of bbox size (0.5 = 50%)
+        min_size: Minimum crop width/height in pixels
+        
+    Returns:
+        Cropped PIL Image
+    """
+    crop_box = compute_crop_boxes([bbox], image.size, padding_percent, min_size)[0]
+    return image.crop(tuple(crop_box.tolist()))
+
+
 def resize_image_smart(image: Image.Image, max_width: int, max_height: int, 
                       quality: int = 85, maintain_aspect: bool = True) -> Image.Image:
     """
@@ -92,9 +162,8 @@ def get_cache_path(original_path: str, width: int, height: int, quality: int = 8
     cache_key = f"{original_path}_{width}x{height}_q{quality}"
     cache_hash = hashlib.md5(cache_key.encode()).hexdigest()
     
-    # Use data/cache/thumbnails directory
+    # Use data/cache/thumbnails directory; created on write, not on lookup
     cache_dir = Path("data/cache/thumbnails")
-    cache_dir.mkdir(parents=True, exist_ok=True)
     
     # Get original file extension
     original_ext = Path(original_path).suffix.lower()
@@ -167,8 +236,22 @@ def create_cached_resized_image(original_path: str, width: int, height: int,
         if not original_file.exists():
             return None
         
+        cache_path = get_cache_path(original_path, width, height, quality)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        
         # Load and resize image
         with Image.open(original_file) as image:
+            # A JPEG that already fits needs no decode/re-encode round trip
+            if (image.format == 'JPEG' and cache_path.suffix.lower() in ['.jpg', '.jpeg']
+                    and image.width <= width and image.height <= height):
+                shutil.copyfile(original_file, cache_path)
+                return cache_path
+            
+            # Let libjpeg decode at a reduced scale (1/2, 1/4, 1/8) that is
+            # still at least the target size; no-op for non-JPEG files
+            if width > 0 and height > 0:
+                image.draft("RGB", (width, height))
+            
             # Convert to RGB if needed (for transparency handling)
             if image.mode in ('RGBA', 'LA', 'P'):
                 # Create a white background
@@ -180,12 +263,6 @@ def create_cached_resized_image(original_path: str, width: int, height: int,
             
             resized_image = resize_image_smart(image, width, height, quality)
             
-            # Save to cache
-            cache_path = get_cache_path(original_path, width, height, quality)
-            
-            # Ensure directory exists
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Save with appropriate format
             if cache_path.suffix.lower() in ['.jpg', '.jpeg']:
                 resized_image.save(cache_path, 'JPEG', quality=quality, optimize=True)
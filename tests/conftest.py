@@ -2,12 +2,60 @@
 
 import pytest
 from playwright.sync_api import Page
-import subprocess
+import threading
 import time
 import socket
 from pathlib import Path
 import shutil
+import sqlite3
 import os
+import hashlib
+from contextlib import closing
+
+# Keep the throwaway databases on a RAM-backed filesystem when there is one
+TEST_DB_DIR = Path("/dev/shm") if os.access("/dev/shm", os.W_OK) else Path(".")
+
+# Each pytest-xdist worker runs its own server, so it gets its own database
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+ALEMBIC_DIR = Path(__file__).parent.parent / "alembic"
+
+
+def migrations_hash():
+    """Hash the migration scripts so a stale migrated template is never reused."""
+    digest = hashlib.sha1()
+    for path in [ALEMBIC_DIR / "env.py", *sorted((ALEMBIC_DIR / "versions").glob("*.py"))]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# Database used by the live test server, and a freshly migrated copy of it
+# that outlives the session and is shared by all workers
+TEST_DB = str(TEST_DB_DIR / f"test_foe_be_gone_{WORKER_ID}.db")
+TEMPLATE_DB = str(TEST_DB_DIR / f"test_foe_be_gone_template_{migrations_hash()}.db")
+
+# Per-connection PRAGMAs for the throwaway test database: no fsync per commit
+TEST_SQLITE_PRAGMAS = "synchronous=NORMAL,temp_store=MEMORY,cache_size=-64000"
+
+# The app and alembic run in this process; point them at the test database
+# before any test module imports app code
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB}"
+os.environ["SQLITE_PRAGMAS"] = TEST_SQLITE_PRAGMAS
+
+
+def pytest_configure(config):
+    """Screenshot failing browser tests unless --screenshot was given.
+    
+    Set here rather than in addopts, which would make pytest reject the
+    command line whenever the pytest-playwright plugin isn't loaded. Video
+    and tracing stay off because "retain-on-failure" still records every
+    passing test.
+    """
+    if not config.pluginmanager.hasplugin("playwright"):
+        return
+    if any(arg.startswith("--screenshot") for arg in config.invocation_params.args):
+        return
+    config.option.screenshot = "only-on-failure"
 
 
 def find_free_port():
@@ -19,109 +67,247 @@ def find_free_port():
     return port
 
 
+def remove_test_databases():
+    """Delete the test database and its WAL files."""
+    for db_file in (TEST_DB, f"{TEST_DB}-wal", f"{TEST_DB}-shm"):
+        if os.path.exists(db_file):
+            os.remove(db_file)
+
+
+def build_template_database():
+    """Migrate the test database and publish it as the template."""
+    from alembic import command
+    from alembic.config import Config
+    
+    # No ini file: env.py then leaves the test session's logging alone
+    alembic_config = Config()
+    alembic_config.set_main_option("script_location", str(ALEMBIC_DIR))
+    command.upgrade(alembic_config, "head")
+    
+    # WAL is stored in the database file, so the server and the template get it
+    with closing(sqlite3.connect(TEST_DB)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    
+    # Templates built from older migrations are never used again
+    for stale in TEST_DB_DIR.glob("test_foe_be_gone_template_*.db"):
+        if stale.name != Path(TEMPLATE_DB).name:
+            stale.unlink(missing_ok=True)
+    
+    # Publish atomically: another xdist worker may be building it too
+    tmp_template = f"{TEMPLATE_DB}.{WORKER_ID}.tmp"
+    shutil.copyfile(TEST_DB, tmp_template)
+    os.replace(tmp_template, TEMPLATE_DB)
+
+
 @pytest.fixture(scope="session")
-def live_server_url():
+def test_database():
+    """Create the test database from the migrated template.
+    
+    Not autouse: only tests that use the app or its database request it,
+    so DB-free unit tests never run migrations.
+    
+    Migrations only run when no template exists for the current migration
+    scripts; otherwise the template is copied into place.
+    """
+    remove_test_databases()
+    
+    if os.path.exists(TEMPLATE_DB):
+        shutil.copyfile(TEMPLATE_DB, TEST_DB)
+    else:
+        build_template_database()
+    
+    yield
+    
+    remove_test_databases()
+
+
+@pytest.fixture(scope="session")
+def live_server_url(test_database):
     """Start the FastAPI server for testing."""
-    port = find_free_port()
+    import uvicorn
+    from app.main import app
     
-    # Create a test database
-    test_db = "test_foe_be_gone.db"
-    if os.path.exists(test_db):
-        os.remove(test_db)
+    port = find_free_port()
     
-    # Set test database environment variable
-    env = os.environ.copy()
-    env["DATABASE_URL"] = f"sqlite:///{test_db}"
+    # Serve the app from a thread in this process: no interpreter startup
+    # or second import of the whole app
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
     
-    # Run migrations
-    subprocess.run(["uv", "run", "alembic", "upgrade", "head"], env=env, check=True)
+    # Wait until the server is listening instead of sleeping a fixed time
+    deadline = time.monotonic() + 30
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("Test server exited during startup")
+        if time.monotonic() > deadline:
+            server.should_exit = True
+            raise RuntimeError("Test server did not become ready within 30s")
+        time.sleep(0.01)
     
-    # Start the server
-    process = subprocess.Popen(
-        ["uv", "run", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "debug"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,  # Combine stdout and stderr
-        env=env,
-        text=True
-    )
+    url = f"http://127.0.0.1:{port}"
     
-    # Give the server time to start
-    time.sleep(2)
+    # Render the dashboard and the tests page once so template compilation
+    # and lazy imports are not charged to the first browser test
+    import httpx
+    for path in ("/", "/settings/tests"):
+        httpx.get(f"{url}{path}", timeout=30).raise_for_status()
     
-    yield f"http://localhost:{port}"
+    yield url
     
     # Cleanup
-    process.terminate()
+    server.should_exit = True
+    thread.join(timeout=10)
+
+
+@pytest.fixture(scope="session")
+def client(test_database):
+    """In-process client for the FastAPI app, created on first use."""
+    from fastapi.testclient import TestClient
+    from app.main import app
     
-    # Print server output for debugging
-    if process.stdout:
-        output = process.stdout.read()
-        if output:
-            print("\n=== Server Output ===")
-            print(output)
-            print("===================\n")
+    # Without the lifespan: the live server may already run the app's
+    # background workers in this process
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def db_engine(test_database, live_server_url):
+    """Engine on the live server's database, for seeding test data."""
+    from sqlalchemy import event
+    from sqlmodel import create_engine
+    
+    engine = create_engine(f"sqlite:///{TEST_DB}")
+    
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        for pragma in TEST_SQLITE_PRAGMAS.split(","):
+            dbapi_connection.execute(f"PRAGMA {pragma}")
+        # Tests serialize their own writes; contention is a bug, not a wait
+        dbapi_connection.execute("PRAGMA busy_timeout=0")
+    
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(test_database, db_engine):
+    """Database session on the live server's database."""
+    from sqlmodel import Session
+    
+    with Session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def settings_service(session):
+    """SettingsService bound to the test session, shared within a test."""
+    from app.services.settings_service import SettingsService
+    
+    return SettingsService(session)
+
+
+@pytest.fixture
+def seed_db(test_database, db_engine):
+    """Return a function that bulk-inserts model instances in one transaction.
     
-    process.wait()
+    Rows are grouped per table and sent as one executemany INSERT each,
+    skipping ORM unit-of-work bookkeeping. Pass parents before children.
+    """
+    from sqlalchemy import insert
+    from sqlmodel import Session
     
-    # Remove test database
-    if os.path.exists(test_db):
-        os.remove(test_db)
+    def seed(*instances):
+        rows_by_model = {}
+        for instance in instances:
+            # model_dump applies the models' Python-side defaults
+            rows_by_model.setdefault(type(instance), []).append(instance.model_dump(exclude_none=True))
+        
+        with Session(db_engine) as session:
+            for model, rows in rows_by_model.items():
+                session.execute(insert(model), rows)
+            session.commit()
+    
+    return seed
 
 
 @pytest.fixture
-def clean_db():
-    """Reset database between tests."""
-    # Clear all tables by recreating the database
-    test_db = "test_foe_be_gone.db"
-    
-    # Set environment for migrations
-    env = os.environ.copy()
-    env["DATABASE_URL"] = f"sqlite:///{test_db}"
-    
-    # Instead of downgrade/upgrade, let's use a more direct approach
-    from sqlmodel import Session, text
-    from app.core.database import engine
-    
-    with Session(engine) as session:
-        # Delete all data from tables in reverse dependency order
-        try:
-            session.exec(text("DELETE FROM sound_effectiveness"))
-        except:
-            pass  # Table might not exist
-        try:
-            session.exec(text("DELETE FROM sound_statistics"))
-        except:
-            pass  # Table might not exist
-        try:
-            session.exec(text("DELETE FROM time_based_effectiveness"))
-        except:
-            pass  # Table might not exist
-        try:
-            session.exec(text("DELETE FROM deterrent_actions"))
-        except:
-            pass  # Table might not exist
-        try:
-            session.exec(text("DELETE FROM foes"))
-        except:
-            pass  # Table might not exist
-        try:
-            session.exec(text("DELETE FROM detections"))
-        except:
-            pass  # Table might not exist
-        session.exec(text("DELETE FROM devices"))
-        session.exec(text("DELETE FROM integration_instances"))
-        session.exec(text("DELETE FROM settings"))
-        session.commit()
+def clean_db(test_database, live_server_url):
+    """Reset the test database to its freshly migrated state."""
+    # The SQLite backup API copies the template pages into the live database
+    # under SQLite's own locking, so the running server sees the reset
+    # without restarting, and it is far cheaper than per-table DELETEs
+    with closing(sqlite3.connect(TEMPLATE_DB, timeout=0)) as template, \
+            closing(sqlite3.connect(TEST_DB, timeout=0)) as test_db:
+        template.backup(test_db)
     
     yield
     
     # Cleanup is automatic when next test runs
 
 
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Assertions and clicks wait for elements to stop moving; with motion turned
+# off dropdowns, modals and toggles settle immediately
+DISABLE_ANIMATIONS_SCRIPT = """
+document.addEventListener("DOMContentLoaded", () => {
+    const style = document.createElement("style");
+    style.textContent = "*, *::before, *::after { animation: none !important; transition: none !important; }";
+    document.head.appendChild(style);
+});
+"""
+
+
+def _abort_static_assets(route):
+    """Abort asset requests that no browser test asserts on."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture(scope="session")
+def prepare_context():
+    """Return a function that trims a browser context down for testing.
+    
+    The context stops loading images, fonts and media and runs pages
+    without CSS animations or transitions. Stylesheets and scripts,
+    including the Tailwind and daisyUI CDNs, still load: they decide what
+    is visible.
+    """
+    def prepare(context):
+        context.route("**/*", _abort_static_assets)
+        context.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
+        return context
+    
+    return prepare
+
+
+@pytest.fixture
+def context(context, prepare_context):
+    """Browser context without images, fonts, media or animations."""
+    return prepare_context(context)
+
+
 @pytest.fixture
 def browser_context_args(browser_context_args):
     """Configure browser context to ignore HTTPS errors."""
     return {
         **browser_context_args,
         "ignore_https_errors": True,
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args):
+    """Launch Chromium without subsystems the tests never use."""
+    return {
+        **browser_type_launch_args,
+        "args": [
+            "--disable-gpu",
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--disable-audio-output",
+            "--disable-features=Translate,BackForwardCache",
+        ],
+    }
@@ -3,13 +3,9 @@ Basic tests for the FastAPI application
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health_check():
+def test_health_check(client):
     """Test the health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
@@ -18,22 +14,15 @@ def test_health_check():
     assert data["version"] == "2.0.0"
 
 
-def test_dashboard_page():
-    """Test the dashboard page returns HTML"""
-    response = client.get("/")
-    assert response.status_code == 200
-    assert "text/html" in response.headers["content-type"]
-    assert "Foe Be Gone" in response.text
-
-
-def test_static_files_accessible():
-    """Test that static files are accessible"""
-    response = client.get("/static/css/main.css")
+@pytest.mark.parametrize("path,content_type,body", [
+    ("/", "text/html", "Foe Be Gone"),  # Dashboard page returns HTML
+    ("/static/css/main.css", "text/css", None),  # Static files are accessible
+    ("/public/logo.jpg", "image/jpeg", None),  # Public files (logo) are accessible
+])
+def test_page_accessible(client, path, content_type, body):
+    """Test that pages and static assets are served with the right content type"""
+    response = client.get(path)
     assert response.status_code == 200
-    assert "text/css" in response.headers["content-type"]
-
-
-def test_public_files_accessible():
-    """Test that public files (logo) are accessible"""
-    response = client.get("/public/logo.jpg")
-    assert response.status_code == 200
\ No newline at end of file
+    assert content_type in response.headers["content-type"]
+    if body is not None:
+        assert body in response.text
@@ -2,30 +2,12 @@
 
 import pytest
 from playwright.sync_api import Page, expect
-from sqlmodel import Session, select
-
-from app.core.database import engine
-from app.models.integration_instance import IntegrationInstance
 
 
 @pytest.fixture(autouse=True)
-def setup_database():
+def setup_database(clean_db):
     """Ensure clean database state for each test."""
-    # Clean up any existing integrations before test
-    with Session(engine) as session:
-        integrations = session.exec(select(IntegrationInstance)).all()
-        for integration in integrations:
-            session.delete(integration)
-        session.commit()
-    
     yield
-    
-    # Clean up after test
-    with Session(engine) as session:
-        integrations = session.exec(select(IntegrationInstance)).all()
-        for integration in integrations:
-            session.delete(integration)
-        session.commit()
 
 
 def test_add_dummy_integration_and_set_test_scenario(page: Page, live_server_url: str):
@@ -46,11 +28,10 @@ def test_add_dummy_integration_and_set_test_scenario(page: Page, live_server_url
     # Wait for dropdown to appear
     expect(page.locator("text=Dummy Surveillance")).to_be_visible()
     
-    # Click on Dummy Surveillance option
-    page.click("text=Dummy Surveillance")
-    
-    # Wait for page reload after integration is added
-    page.wait_for_load_state("networkidle")
+    # Click on Dummy Surveillance option and wait for the create call;
+    # the assertions below wait for the page reload that follows it
+    with page.expect_response(lambda r: r.url.endswith("/api/integrations") and r.request.method == "POST"):
+        page.click("text=Dummy Surveillance")
     
     # Verify integration was added
     expect(page.locator("p:has-text('Type: dummy-surveillance')")).to_be_visible()
@@ -64,36 +45,27 @@ def test_add_dummy_integration_and_set_test_scenario(page: Page, live_server_url
     # Click Test Scenario button to load scenarios
     test_scenario_button.click()
     
-    # Wait for scenarios to load
-    page.wait_for_timeout(500)  # Give time for API call
-    
-    # Verify scenarios are loaded
+    # Verify scenarios are loaded (assertions wait for the API call)
     expect(page.locator("text=Cat")).to_be_visible()
     expect(page.locator("text=Magpie")).to_be_visible()
     expect(page.locator("text=Nothing")).to_be_visible()
     expect(page.locator("text=Hedgehog")).to_be_visible()
     
-    # Click on Cat scenario
-    page.click("text=Cat")
-    
-    # Wait for API call to complete
-    page.wait_for_timeout(1000)
+    # Click on Cat scenario and wait for the API call to complete
+    with page.expect_response("**/api/integrations/**/test-scenario/**"):
+        page.click("text=Cat")
     
     # Test another scenario
     test_scenario_button.click()
-    page.wait_for_timeout(500)  # Wait for dropdown to show
-    page.click("text=Magpie")
-    
-    # Wait for API call to complete
-    page.wait_for_timeout(1000)
+    expect(page.locator("text=Magpie")).to_be_visible()
+    with page.expect_response("**/api/integrations/**/test-scenario/**"):
+        page.click("text=Magpie")
     
     # Test the integration connection
     # Click the three dots menu (actions button)
     actions_button = page.locator(".btn-circle").last
     actions_button.click()
-    # Wait for dropdown menu to appear
-    page.wait_for_timeout(300)
-    # Click on the Test menu item using exact text match
+    # Click on the Test menu item using exact text match (waits for the menu)
     page.get_by_text("Test", exact=True).click()
     
     # Should see success notification
@@ -105,10 +77,8 @@ def test_add_dummy_integration_and_set_test_scenario(page: Page, live_server_url
     page.on("dialog", lambda dialog: dialog.accept())
     
     actions_button.click()  # Click the actions menu again
-    page.click("text=Delete")
-    
-    # Wait for page reload
-    page.wait_for_load_state("networkidle")
+    with page.expect_response(lambda r: "/api/integrations/" in r.url and r.request.method == "DELETE"):
+        page.click("text=Delete")
     
     # Verify integration was deleted
     expect(page.locator("text=No integrations configured")).to_be_visible()
@@ -120,18 +90,20 @@ def test_multiple_integrations_with_different_scenarios(page: Page, live_server_
     # Navigate to integrations page
     page.goto(f"{live_server_url}/settings/integrations")
     
+    integration_cards = page.locator(".card")
+    
     # Add first integration
     page.click("[role='button']:has-text('Add Integration')")
-    page.click("text=Dummy Surveillance")
-    page.wait_for_load_state("networkidle")
+    with page.expect_response(lambda r: r.url.endswith("/api/integrations") and r.request.method == "POST"):
+        page.click("text=Dummy Surveillance")
+    expect(integration_cards).to_have_count(1)
     
     # Add second integration
     page.click("[role='button']:has-text('Add Integration')")
-    page.click("text=Dummy Surveillance")
-    page.wait_for_load_state("networkidle")
+    with page.expect_response(lambda r: r.url.endswith("/api/integrations") and r.request.method == "POST"):
+        page.click("text=Dummy Surveillance")
     
     # Should have 2 integrations now
-    integration_cards = page.locator(".card")
     expect(integration_cards).to_have_count(2)
     
     # Set different scenarios for each
@@ -139,13 +111,11 @@ def test_multiple_integrations_with_different_scenarios(page: Page, live_server_
     
     # First integration - set to cat
     test_buttons.nth(0).click()
-    page.wait_for_timeout(500)
-    page.click("text=Cat")
-    page.wait_for_timeout(500)  # Wait for dropdown to close
+    with page.expect_response("**/api/integrations/**/test-scenario/**"):
+        page.click("text=Cat")
     
     # Second integration - set to squirrel  
     test_buttons.nth(1).click()
-    page.wait_for_timeout(500)
     page.click("text=Squirrel", force=True)
     
     # Verify both were set (check console logs or API calls)
@@ -159,10 +129,11 @@ def test_error_handling_for_invalid_scenario(page: Page, live_server_url: str):
     # Navigate to integrations page
     page.goto(f"{live_server_url}/settings/integrations")
     
-    # Add integration
+    # Add integration and wait for the reloaded page to show it
     page.click("[role='button']:has-text('Add Integration')")
-    page.click("text=Dummy Surveillance")
-    page.wait_for_load_state("networkidle")
+    with page.expect_response(lambda r: r.url.endswith("/api/integrations") and r.request.method == "POST"):
+        page.click("text=Dummy Surveillance")
+    expect(page.locator("[role='button']:has-text('Test Scenario')")).to_be_visible()
     
     # Intercept API call to simulate error
     def handle_route(route):
@@ -172,7 +143,6 @@ def test_error_handling_for_invalid_scenario(page: Page, live_server_url: str):
     
     # Try to set scenario
     page.click("[role='button']:has-text('Test Scenario')")
-    page.wait_for_timeout(300)
     page.click("text=Cat")
     
     # Should see error notification
@@ -0,0 +1,23 @@
+"""Tests for image utility functions."""
+
+import numpy as np
+from app.utils.image_utils import compute_crop_boxes
+
+
+class TestComputeCropBoxes:
+    """Test suite for vectorized crop box computation."""
+    
+    def test_padding_and_min_size(self):
+        """Small boxes are padded and grown to the minimum size."""
+        boxes = compute_crop_boxes([(400, 300, 500, 400), (10, 10, 20, 20)], (1000, 800), 0.5, 224)
+        assert boxes.shape == (2, 4)
+        np.testing.assert_allclose(boxes[0], (338, 238, 562, 462))
+        # Box near the corner is shifted back inside the image
+        np.testing.assert_allclose(boxes[1], (0, 0, 224, 224))
+    
+    def test_stays_within_image(self):
+        """Crops never leave the image, even when larger than it."""
+        boxes = compute_crop_boxes([(0, 0, 180, 90), (150, 50, 200, 100)], (200, 100), 0.5, 224)
+        assert (boxes[:, [0, 1]] >= 0).all()
+        assert (boxes[:, [2, 3]] <= (200, 100)).all()
+        np.testing.assert_allclose(boxes[0], (0, 0, 200, 100))
@@ -1,27 +1,13 @@
 """Simple test for statistics page."""
 import pytest
 from playwright.sync_api import Page, expect
-from sqlmodel import Session
-from sqlalchemy import text
-from app.core.database import engine
-from app.models.detection import Detection
+from app.models.detection import Detection, DetectionStatus
 from app.models.device import Device
 from app.models.integration_instance import IntegrationInstance
 
 
-def test_statistics_page_renders_empty(page: Page, live_server_url: str):
+def test_statistics_page_renders_empty(page: Page, live_server_url: str, clean_db):
     """Test that statistics page renders even with no data."""
-    # Clear any existing data
-    with Session(engine) as session:
-        # Use raw SQL to avoid deprecation warnings
-        session.execute(text("DELETE FROM sound_effectiveness"))
-        session.execute(text("DELETE FROM sound_statistics"))
-        session.execute(text("DELETE FROM foes"))
-        session.execute(text("DELETE FROM detections"))
-        session.execute(text("DELETE FROM devices"))
-        session.execute(text("DELETE FROM integration_instances"))
-        session.commit()
-    
     # Navigate to statistics page
     response = page.goto(f"{live_server_url}/statistics/")
     
@@ -43,43 +29,31 @@ def test_statistics_page_renders_empty(page: Page, live_server_url: str):
     expect(page.locator("#hourlyPatternsChart")).to_be_visible()
 
 
-def test_statistics_page_with_minimal_data(page: Page, live_server_url: str):
+def test_statistics_page_with_minimal_data(page: Page, live_server_url: str, clean_db, seed_db):
     """Test statistics page with minimal data."""
-    with Session(engine) as session:
-        # Clear existing data
-        session.execute(text("DELETE FROM detections"))
-        session.execute(text("DELETE FROM devices"))
-        session.execute(text("DELETE FROM integration_instances"))
-        
-        # Add minimal data
-        integration = IntegrationInstance(
+    # Add minimal data: one integration, one camera, one detection
+    seed_db(
+        IntegrationInstance(
             id="test-int",
             integration_type="test",
             name="Test Integration",
             status="connected"
-        )
-        session.add(integration)
-        
-        device = Device(
+        ),
+        Device(
             id="test-dev",
             integration_id="test-int",
             device_type="camera",
             name="Test Camera",
             status="online"
-        )
-        session.add(device)
-        
-        # Add one detection
-        from app.models.detection import DetectionStatus
-        detection = Detection(
+        ),
+        Detection(
             device_id="test-dev",
             status=DetectionStatus.PROCESSED,
             detected_foe="crows",
             deterrent_effective=True,
             ai_cost=0.01
         )
-        session.add(detection)
-        session.commit()
+    )
     
     # Navigate to statistics page
     response = page.goto(f"{live_server_url}/statistics/")
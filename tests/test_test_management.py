@@ -4,276 +4,217 @@ from accessing the main tests page to creating and running test runs.
 """
 
 import pytest
-from playwright.sync_api import Page, expect
-import time
+from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeoutError
+
+# These journeys are only verified in Chromium; under --browser=all the other
+# browsers skip them instead of each test being re-parametrized
+pytestmark = pytest.mark.only_browser("chromium")
+
+# Stat card titles on the test images page
+TEST_IMAGES_PAGE_STATS = ["Total Images", "Total Labels"]
+
+# (CSS selector, text) pairs that make up the tests page header
+TESTS_PAGE_HEADER = [
+    ("h1", "Tests"),
+    ("p", "Model performance evaluation"),
+    (".stat-title", "Total Runs"),
+    (".stat-title", "Test Images"),
+    ("a[href='/settings/tests/images']", "Manage Images"),
+    ("a[href='/settings/tests/new']", "New Test Run"),
+]
+
+# Returns the (selector, text) pairs without a visible matching element
+MISSING_ELEMENTS_PROBE = """expected => expected.filter(([selector, text]) =>
+    ![...document.querySelectorAll(selector)].some(
+        element => element.textContent.includes(text) && element.checkVisibility()
+    )
+)"""
+
+
+def expect_all_visible(page: Page, expected: list, timeout: float = 5000):
+    """Wait until each (CSS selector, text) pair matches a visible element.
+    
+    All pairs are checked by one probe in the page instead of one
+    protocol round-trip per expect().
+    """
+    try:
+        page.wait_for_function(
+            f"expected => ({MISSING_ELEMENTS_PROBE})(expected).length === 0",
+            arg=expected,
+            timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        missing = page.evaluate(MISSING_ELEMENTS_PROBE, expected)
+        raise AssertionError(f"Elements not visible: {missing}")
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
 def test_tests_main_page_navigation(page: Page, live_server_url: str, clean_db):
     """Test navigation to tests page and basic structure."""
     # Go to dashboard
     page.goto(live_server_url)
     
     # Click on the menu dropdown to find Tests
-    page.click("[role='button']:has-text('•••')")
+    page.get_by_role("button", name="•••").click()
     
     # Click on Tests in the dropdown
-    page.click("text=Tests")
+    page.get_by_role("link", name="Tests", exact=True).click()
     
     # Should be on tests page
     expect(page).to_have_url(f"{live_server_url}/settings/tests")
     
-    # Check page title and header
-    expect(page.locator("h1")).to_contain_text("Tests")
-    expect(page.locator("text=Model performance evaluation")).to_be_visible()
-    
-    # Check stats cards are present
-    expect(page.locator("text=Total Runs")).to_be_visible()
-    expect(page.locator("text=Test Images")).to_be_visible()
-    
-    # Check action buttons are present
-    expect(page.locator("text=Manage Images")).to_be_visible()
-    expect(page.locator("text=New Test Run")).to_be_visible()
+    # Check page title, stats cards and action buttons pointing at their pages
+    expect_all_visible(page, TESTS_PAGE_HEADER)
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_empty_state_display(page: Page, live_server_url: str, clean_db):
-    """Test that empty state is displayed when no test runs exist."""
-    # Go to tests page
+def test_tests_page_content(page: Page, live_server_url: str, clean_db):
+    """Test the empty state and basic accessibility of the tests page."""
     page.goto(f"{live_server_url}/settings/tests")
     
-    # Should show empty state
-    expect(page.locator("text=No Test Runs Yet")).to_be_visible()
-    expect(page.locator("text=Start by creating a new test run")).to_be_visible()
-    expect(page.locator("text=Create First Test Run")).to_be_visible()
-
-
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_manage_images_navigation(page: Page, live_server_url: str, clean_db):
-    """Test navigation to test images management page."""
-    # Go to tests page
-    page.goto(f"{live_server_url}/settings/tests")
+    # Should show empty state since no test runs exist
+    for locator in [
+        page.get_by_role("heading", name="No Test Runs Yet"),
+        page.get_by_text("Start by creating a new test run"),
+        page.get_by_role("link", name="Create First Test Run"),
+    ]:
+        expect(locator).to_be_visible()
     
-    # Click Manage Images button
-    page.click("text=Manage Images")
-    
-    # Should be on test images page
-    expect(page).to_have_url(f"{live_server_url}/settings/tests/images")
-    
-    # Check page structure
-    expect(page.locator("h1")).to_contain_text("Test Images")
-    expect(page.locator("text=Back to Tests")).to_be_visible()
-    
-    # Should show empty state since no images exist
-    expect(page.locator("text=No test images yet")).to_be_visible()
-
-
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_new_test_run_navigation(page: Page, live_server_url: str, clean_db):
-    """Test navigation to new test run page."""
-    # Go to tests page
-    page.goto(f"{live_server_url}/settings/tests")
+    # Check that main navigation has proper ARIA attributes
+    expect(page.get_by_role("heading", level=1)).to_be_visible()
     
-    # Click New Test Run button
-    page.click("text=New Test Run")
+    # Check that buttons are keyboard accessible
+    page.keyboard.press("Tab")  # Should focus on first interactive element
     
-    # Should be on new test run page (which reuses test images template)
-    expect(page).to_have_url(f"{live_server_url}/settings/tests/new")
+    # Check that the New Test Run button can be activated with keyboard
+    expect(page.get_by_role("link", name="New Test Run")).to_be_visible()
     
-    # Check page shows new test mode
-    expect(page.locator("h1")).to_contain_text("New Test Run")
-    expect(page.locator("text=Select images to test your AI models")).to_be_visible()
-    expect(page.locator("text=Back to Tests")).to_be_visible()
+    # Check that images show proper alt text or accessibility attributes
+    images = page.locator("img")
+    for i in range(images.count()):
+        img = images.nth(i)
+        # Each image should have alt text or aria-label
+        alt_text = img.get_attribute("alt")
+        aria_label = img.get_attribute("aria-label")
+        assert alt_text is not None or aria_label is not None, f"Image {i} missing accessibility text"
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_back_navigation_links(page: Page, live_server_url: str, clean_db):
-    """Test that back navigation links work correctly."""
-    # Start from tests page
-    page.goto(f"{live_server_url}/settings/tests")
+def test_test_images_page(page: Page, live_server_url: str, clean_db):
+    """Test the test images management page that Manage Images links to."""
+    # The link target is checked in test_tests_main_page_navigation
+    page.goto(f"{live_server_url}/settings/tests/images")
     
-    # Go to manage images
-    page.click("text=Manage Images")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests/images")
+    # Check page structure and a way back to the tests page
+    expect(page.get_by_role("heading", level=1)).to_contain_text("Test Images")
+    expect(page.get_by_role("link", name="Back to Tests")).to_have_attribute("href", "/settings/tests")
+    expect(page.get_by_text("Evaluate model performance")).to_be_visible()
     
-    # Click back to tests
-    page.click("text=Back to Tests")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests")
+    # Stats should show 0 values
+    for title in TEST_IMAGES_PAGE_STATS:
+        expect(page.get_by_text(title, exact=True)).to_be_visible()
     
-    # Go to new test run
-    page.click("text=New Test Run")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests/new")
+    # Should show empty state since no images exist
+    expect(page.get_by_role("heading", name="No Test Images Yet")).to_be_visible()
     
-    # Click back to tests
-    page.click("text=Back to Tests")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests")
+    # New test mode content is not shown on the regular page
+    expect(page.get_by_text("Select images to test your AI models")).not_to_be_visible()
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_test_images_with_data(page: Page, live_server_url: str, clean_db):
-    """Test test images page behavior when test images exist."""
-    # First, create a test image via API (simulate having data)
-    # This would require setting up test data, but for now we test the UI structure
+def test_new_test_run_page(page: Page, live_server_url: str, clean_db):
+    """Test the new test run page that New Test Run links to."""
+    # The link target is checked in test_tests_main_page_navigation; the
+    # page reuses the test images template
+    page.goto(f"{live_server_url}/settings/tests/new")
     
-    # Go to test images page
-    page.goto(f"{live_server_url}/settings/tests/images")
+    # Check page shows new test mode and a way back to the tests page
+    expect(page.get_by_role("heading", level=1)).to_contain_text("New Test Run")
+    expect(page.get_by_role("link", name="Back to Tests")).to_have_attribute("href", "/settings/tests")
     
-    # Check that page loads correctly even with no data
-    expect(page.locator("h1")).to_contain_text("Test Images")
-    expect(page.locator("text=Evaluate model performance")).to_be_visible()
+    # New test mode should show creation-specific content
+    for locator in [
+        page.get_by_text("Select images to test your AI models"),
+        page.get_by_role("heading", name="Create New Test Run"),
+        page.get_by_text("Select the test images you want to use"),
+    ]:
+        expect(locator).to_be_visible()
     
-    # Stats should show 0 values
-    expect(page.locator("text=Total Images")).to_be_visible()
-    expect(page.locator("text=Total Labels")).to_be_visible()
+    # Regular test images page content is not shown in new test mode
+    expect(page.get_by_text("Evaluate model performance")).not_to_be_visible()
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_new_test_mode_differences(page: Page, live_server_url: str, clean_db):
-    """Test that new test mode shows different content than regular test images page."""
-    # Regular test images page
+def test_back_navigation_links(page: Page, live_server_url: str, clean_db):
+    """Test that back navigation links work correctly."""
+    # Follow the back link once from the images page
     page.goto(f"{live_server_url}/settings/tests/images")
-    regular_content = page.locator("text=Evaluate model performance").is_visible()
+    page.get_by_role("link", name="Back to Tests").click()
+    expect(page).to_have_url(f"{live_server_url}/settings/tests")
     
-    # New test run page
+    # The new test run page shares the template, so checking its target is enough
     page.goto(f"{live_server_url}/settings/tests/new")
-    new_test_content = page.locator("text=Select images to test your AI models").is_visible()
-    
-    # They should show different content
-    assert regular_content != new_test_content or (regular_content == False and new_test_content == True)
-    
-    # New test mode should show creation-specific content
-    expect(page.locator("text=Create New Test Run")).to_be_visible()
-    expect(page.locator("text=Select the test images you want to use")).to_be_visible()
+    expect(page.get_by_role("link", name="Back to Tests")).to_have_attribute("href", "/settings/tests")
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
 def test_responsive_layout(page: Page, live_server_url: str, clean_db):
     """Test that the tests page layout works on different screen sizes."""
     # Test desktop layout
     page.set_viewport_size({"width": 1200, "height": 800})
     page.goto(f"{live_server_url}/settings/tests")
     
+    heading = ("h1", "Tests")
+    total_runs = (".stat-title", "Total Runs")
+    new_test_run = ("a[href='/settings/tests/new']", "New Test Run")
+    
     # Check that elements are visible
-    expect(page.locator("h1")).to_be_visible()
-    expect(page.locator("text=Total Runs")).to_be_visible()
-    expect(page.locator("text=New Test Run")).to_be_visible()
+    expect_all_visible(page, [heading, total_runs, new_test_run])
     
-    # Test tablet layout
+    # Test tablet layout; the layout is CSS-only, so resizing reflows the
+    # page without reloading it
     page.set_viewport_size({"width": 768, "height": 1024})
-    page.reload()
     
     # Elements should still be visible
-    expect(page.locator("h1")).to_be_visible()
-    expect(page.locator("text=Total Runs")).to_be_visible()
-    expect(page.locator("text=New Test Run")).to_be_visible()
+    expect_all_visible(page, [heading, total_runs, new_test_run])
     
     # Test mobile layout
     page.set_viewport_size({"width": 375, "height": 667})
-    page.reload()
     
     # Elements should still be visible and usable
-    expect(page.locator("h1")).to_be_visible()
-    expect(page.locator("text=New Test Run")).to_be_visible()
-
-
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_error_handling_invalid_routes(page: Page, live_server_url: str, clean_db):
-    """Test error handling for invalid test-related routes."""
-    # Test invalid test run ID
-    page.goto(f"{live_server_url}/settings/test-runs/99999")
-    
-    # Should show error or redirect (depends on implementation)
-    # For now, just check page loads
-    expect(page).to_have_url(f"{live_server_url}/settings/test-runs/99999")
-    
-    # Test invalid test image ID for editing
-    page.goto(f"{live_server_url}/settings/tests/images/99999/edit")
-    
-    # Should show error or redirect
-    expect(page).to_have_url(f"{live_server_url}/settings/tests/images/99999/edit")
+    expect_all_visible(page, [heading, new_test_run])
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_navigation_breadcrumbs(page: Page, live_server_url: str, clean_db):
-    """Test that navigation maintains proper context throughout the workflow."""
-    # Start from dashboard
-    page.goto(live_server_url)
-    expect(page.locator("text=Foe Be Gone")).to_be_visible()
-    
-    # Navigate to tests
-    page.click("[role='button']:has-text('•••')")
-    page.click("text=Tests")
-    
-    # Should have proper context
-    expect(page).to_have_url(f"{live_server_url}/settings/tests")
-    expect(page.locator("h1")).to_contain_text("Tests")
-    
-    # Navigate to images management
-    page.click("text=Manage Images")
-    expect(page.locator("text=Back to Tests")).to_be_visible()
-    
-    # Return to tests
-    page.click("text=Back to Tests")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests")
-    
-    # Navigate to new test run
-    page.click("text=New Test Run")
-    expect(page.locator("text=Back to Tests")).to_be_visible()
-    
-    # Return to tests
-    page.click("text=Back to Tests")
-    expect(page).to_have_url(f"{live_server_url}/settings/tests")
+@pytest.mark.parametrize("path", [
+    "/settings/test-runs/99999",  # Invalid test run ID
+    "/settings/tests/images/99999/edit",  # Invalid test image ID for editing
+])
+def test_error_handling_invalid_routes(client, path):
+    """Test that invalid test-related routes return 404."""
+    response = client.get(path)
+    assert response.status_code == 404
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
-def test_accessibility_basics(page: Page, live_server_url: str, clean_db):
-    """Test basic accessibility features of the test management interface."""
-    # Go to tests page
-    page.goto(f"{live_server_url}/settings/tests")
-    
-    # Check that main navigation has proper ARIA attributes
-    expect(page.locator("h1")).to_be_visible()
-    
-    # Check that buttons are keyboard accessible
-    page.keyboard.press("Tab")  # Should focus on first interactive element
-    
-    # Check that the New Test Run button can be activated with keyboard
-    new_test_button = page.locator("text=New Test Run")
-    expect(new_test_button).to_be_visible()
-    
-    # Check that images show proper alt text or accessibility attributes
-    images = page.locator("img")
-    if images.count() > 0:
-        for i in range(images.count()):
-            img = images.nth(i)
-            # Each image should have alt text or aria-label
-            alt_text = img.get_attribute("alt")
-            aria_label = img.get_attribute("aria-label")
-            assert alt_text is not None or aria_label is not None, f"Image {i} missing accessibility text"
+def dom_content_loaded_ms(page: Page) -> float:
+    """Return the current document's DOMContentLoaded time from Navigation Timing."""
+    return page.wait_for_function("""() => {
+        const [entry] = performance.getEntriesByType("navigation");
+        return entry && entry.domContentLoadedEventEnd > 0 ? entry.domContentLoadedEventEnd : null;
+    }""").json_value()
 
 
-@pytest.mark.parametrize("browser_name", ["chromium"])
 def test_page_performance(page: Page, live_server_url: str, clean_db):
     """Test that pages load within reasonable time."""
-    start_time = time.time()
-    
     # Load tests page
     page.goto(f"{live_server_url}/settings/tests")
     
     # Check page loaded
-    expect(page.locator("h1")).to_be_visible()
-    
-    load_time = time.time() - start_time
+    expect(page.get_by_role("heading", level=1)).to_be_visible()
     
-    # Page should load within 5 seconds (generous for test environment)
-    assert load_time < 5.0, f"Page took {load_time:.2f}s to load, expected < 5s"
+    # Timings come from the browser, so fixture and protocol overhead are excluded;
+    # the budget covers the blocking Tailwind CDN script on a cold cache
+    load_time = dom_content_loaded_ms(page)
+    assert load_time < 3000, f"Page took {load_time:.0f}ms to load, expected < 3000ms"
     
     # Navigate to images page
-    start_time = time.time()
-    page.click("text=Manage Images")
-    expect(page.locator("text=Test Images")).to_be_visible()
+    page.get_by_role("link", name="Manage Images").click()
+    expect(page.get_by_role("heading", level=1)).to_contain_text("Test Images")
     
-    navigation_time = time.time() - start_time
+    navigation_time = dom_content_loaded_ms(page)
     
     # Navigation should be fast
-    assert navigation_time < 3.0, f"Navigation took {navigation_time:.2f}s, expected < 3s"
\ No newline at end of file
+    assert navigation_time < 2000, f"Navigation took {navigation_time:.0f}ms, expected < 2000ms"
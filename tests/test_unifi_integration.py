@@ -1,82 +1,138 @@
 """Tests for UniFi Protect integration."""
 
 import pytest
+from contextlib import contextmanager
 from playwright.sync_api import Page, expect
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
 import httpx
 
 
-@pytest.fixture
-def mock_unifi_api():
-    """Mock UniFi API responses."""
+# Canned UniFi Protect API payloads, built once for the module
+META_JSON = {"applicationVersion": "4.0.53"}
+
+CAMERAS_JSON = [
+    {
+        "id": "camera1",
+        "name": "Front Door Camera",
+        "modelKey": "UVC-G4-PRO",
+        "state": "CONNECTED",
+        "isMicEnabled": True,
+        "featureFlags": {
+            "hasHdr": True,
+            "smartDetectTypes": ["person", "vehicle"],
+            "hasMic": True,
+            "hasLedStatus": True,
+            "hasSpeaker": False
+        },
+        "smartDetectSettings": {
+            "objectTypes": ["person"],
+            "audioTypes": []
+        }
+    },
+    {
+        "id": "camera2",
+        "name": "Backyard Camera",
+        "modelKey": "UVC-G3-FLEX",
+        "state": "CONNECTED",
+        "isMicEnabled": False,
+        "featureFlags": {
+            "hasHdr": False,
+            "smartDetectTypes": [],
+            "hasMic": False,
+            "hasLedStatus": True,
+            "hasSpeaker": False
+        },
+        "smartDetectSettings": {
+            "objectTypes": [],
+            "audioTypes": []
+        }
+    }
+]
+
+
+def _mock_response(payload, status_code=200):
+    """Build a stand-in for an httpx response; its json() is synchronous."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    return response
+
+
+def _make_mock_get(meta_json, cameras_json):
+    """Build an AsyncClient.get replacement that answers by URL."""
+    meta_response = _mock_response(meta_json)
+    cameras_response = _mock_response(cameras_json)
+    
+    async def mock_get(url, *args, **kwargs):
+        if url.endswith("/cameras"):
+            return cameras_response
+        # /meta/info and anything else
+        return meta_response
+    
+    return mock_get
+
+
+async def _unauthorized_get(url, *args, **kwargs):
+    """AsyncClient.get replacement for a controller that rejects the API key."""
+    return _mock_response(None, status_code=401)
+
+
+async def _unreachable_get(url, *args, **kwargs):
+    """AsyncClient.get replacement for a controller that cannot be reached."""
+    raise httpx.ConnectError("Connection refused")
+
+
+@contextmanager
+def patch_unifi_api(cameras_json=CAMERAS_JSON, get=None):
+    """Patch the UniFi Protect HTTP client to serve the canned payloads.
+    
+    Args:
+        cameras_json: Camera list returned by the cameras endpoint
+        get: Optional replacement for AsyncClient.get, overriding the payloads
+    """
     with patch("app.integrations.unifi_protect.unifi_protect.httpx.AsyncClient") as mock_client:
         instance = AsyncMock()
         mock_client.return_value = instance
-        
-        # Mock successful connection test
-        meta_response = AsyncMock()
-        meta_response.status_code = 200
-        meta_response.json.return_value = {"applicationVersion": "4.0.53"}
-        
-        # Mock camera listing
-        cameras_response = AsyncMock()
-        cameras_response.status_code = 200
-        cameras_response.json.return_value = [
-            {
-                "id": "camera1",
-                "name": "Front Door Camera",
-                "modelKey": "UVC-G4-PRO",
-                "state": "CONNECTED",
-                "isMicEnabled": True,
-                "featureFlags": {
-                    "hasHdr": True,
-                    "smartDetectTypes": ["person", "vehicle"],
-                    "hasMic": True,
-                    "hasLedStatus": True,
-                    "hasSpeaker": False
-                },
-                "smartDetectSettings": {
-                    "objectTypes": ["person"],
-                    "audioTypes": []
-                }
-            },
-            {
-                "id": "camera2",
-                "name": "Backyard Camera",
-                "modelKey": "UVC-G3-FLEX",
-                "state": "CONNECTED",
-                "isMicEnabled": False,
-                "featureFlags": {
-                    "hasHdr": False,
-                    "smartDetectTypes": [],
-                    "hasMic": False,
-                    "hasLedStatus": True,
-                    "hasSpeaker": False
-                },
-                "smartDetectSettings": {
-                    "objectTypes": [],
-                    "audioTypes": []
-                }
-            }
-        ]
-        
-        # Configure mock to return different responses based on URL
-        async def mock_get(url, *args, **kwargs):
-            if url.endswith("/meta/info"):
-                return meta_response
-            elif url.endswith("/cameras"):
-                return cameras_response
-            else:
-                # Default response
-                return meta_response
-        
-        instance.get = mock_get
+        instance.get = get or _make_mock_get(META_JSON, cameras_json)
         instance.aclose = AsyncMock()
         
         yield mock_client
 
 
+@pytest.fixture
+def mock_unifi_api():
+    """Mock UniFi API responses."""
+    with patch_unifi_api() as mock_client:
+        yield mock_client
+
+
+def create_unifi_integration(page: Page, live_server_url: str) -> dict:
+    """Create a UniFi Protect integration through the API, as the setup form does."""
+    response = page.request.post(f"{live_server_url}/api/integrations", data={
+        "integration_type": "unifi_protect",
+        "name": "UniFi Protect",
+        "config": {"host": "https://192.168.1.1", "api_key": "test-api-key-123"}
+    })
+    assert response.ok, response.text()
+    return response.json()
+
+
+def select_unifi_cameras(page: Page, live_server_url: str, integration_id: str, camera_ids: list):
+    """Save a camera selection through the API, as the Select Cameras dialog does."""
+    response = page.request.put(
+        f"{live_server_url}/api/integrations/{integration_id}/cameras",
+        data={"enabled_cameras": camera_ids}
+    )
+    assert response.ok, response.text()
+
+
+@pytest.fixture
+def unifi_integration(page: Page, mock_unifi_api, live_server_url, clean_db):
+    """UniFi Protect integration that already exists when the test starts."""
+    return create_unifi_integration(page, live_server_url)
+
+
 def test_add_unifi_integration(page: Page, mock_unifi_api, live_server_url, clean_db):
     """Test adding a UniFi Protect integration."""
     page.goto(f"{live_server_url}/settings/integrations")
@@ -113,47 +169,30 @@ def test_add_unifi_integration(page: Page, mock_unifi_api, live_server_url, clea
             raise AssertionError(f"Integration creation failed: {error_alert.text_content()}")
 
 
-def test_unifi_integration_invalid_credentials(page: Page, live_server_url, clean_db):
-    """Test UniFi integration with invalid credentials."""
-    with patch("app.integrations.unifi_protect.unifi_protect.httpx.AsyncClient") as mock_client:
-        instance = AsyncMock()
-        mock_client.return_value = instance
-        
-        # Mock failed connection (401 Unauthorized)
-        failed_response = AsyncMock()
-        failed_response.status_code = 401
-        instance.get.return_value = failed_response
-        instance.aclose = AsyncMock()
-        
+@pytest.mark.parametrize("api_key,mock_get", [
+    ("invalid-api-key", _unauthorized_get),  # 401 Unauthorized
+    ("test-api-key-123", _unreachable_get),  # Network error
+], ids=["invalid-credentials", "network-error"])
+def test_unifi_connection_failure(page: Page, live_server_url, clean_db, api_key, mock_get):
+    """Test that a UniFi integration that cannot connect shows an error status."""
+    with patch_unifi_api(get=mock_get):
         page.goto(f"{live_server_url}/settings/integrations")
         
         # Add integration
         page.get_by_role("button", name="Add Integration").click()
         page.get_by_role("link", name="UniFi Protect Connect to").click()
-        
-        # Fill in configuration with invalid credentials
         page.fill('input[name="host"]', "https://192.168.1.1")
-        page.fill('input[name="api_key"]', "invalid-api-key")
-        
-        # Submit form
+        page.fill('input[name="api_key"]', api_key)
         page.get_by_role("button", name="Connect").click()
         
         # Wait for error status
-        page.wait_for_load_state("domcontentloaded")
         expect(page.get_by_role("heading", name="UniFi Protect", exact=True)).to_be_visible()
         expect(page.get_by_text("Error")).to_be_visible()
 
 
-def test_unifi_test_connection(page: Page, mock_unifi_api, live_server_url, clean_db):
+def test_unifi_test_connection(page: Page, unifi_integration, live_server_url):
     """Test the connection test functionality."""
-    # First add an integration
     page.goto(f"{live_server_url}/settings/integrations")
-    page.get_by_role("button", name="Add Integration").click()
-    page.get_by_role("link", name="UniFi Protect Connect to").click()
-    page.fill('input[name="host"]', "https://192.168.1.1")
-    page.fill('input[name="api_key"]', "test-api-key-123")
-    page.get_by_role("button", name="Connect").click()
-    page.wait_for_load_state("domcontentloaded")
     
     # Click actions menu
     page.locator(".dropdown .btn-ghost.btn-circle").first.click()
@@ -165,16 +204,9 @@ def test_unifi_test_connection(page: Page, mock_unifi_api, live_server_url, clea
     expect(page.get_by_text("Connected successfully")).to_be_visible(timeout=5000)
 
 
-def test_unifi_camera_selection(page: Page, mock_unifi_api, live_server_url, clean_db):
+def test_unifi_camera_selection(page: Page, unifi_integration, live_server_url):
     """Test camera selection functionality."""
-    # First add an integration
     page.goto(f"{live_server_url}/settings/integrations")
-    page.get_by_role("button", name="Add Integration").click()
-    page.get_by_role("link", name="UniFi Protect Connect to").click()
-    page.fill('input[name="host"]', "https://192.168.1.1")
-    page.fill('input[name="api_key"]', "test-api-key-123")
-    page.get_by_role("button", name="Connect").click()
-    page.wait_for_load_state("domcontentloaded")
     
     # Click Select Cameras button
     page.get_by_role("button", name="Select Cameras").click()
@@ -191,44 +223,16 @@ def test_unifi_camera_selection(page: Page, mock_unifi_api, live_server_url, cle
     page.get_by_role("button", name="Save Selection").click()
     
     # Wait for page reload and verify camera is shown
-    page.wait_for_load_state("domcontentloaded")
     expect(page.get_by_text("Front Door Camera")).to_be_visible()
 
 
 def test_unifi_camera_selection_empty(page: Page, live_server_url, clean_db):
     """Test camera selection when no cameras are available."""
-    with patch("app.integrations.unifi_protect.unifi_protect.httpx.AsyncClient") as mock_client:
-        instance = AsyncMock()
-        mock_client.return_value = instance
-        
-        # Mock successful connection but empty camera list
-        meta_response = AsyncMock()
-        meta_response.status_code = 200
-        meta_response.json.return_value = {"applicationVersion": "4.0.53"}
-        
-        cameras_response = AsyncMock()
-        cameras_response.status_code = 200
-        cameras_response.json.return_value = []
-        
-        async def mock_get(url, *args, **kwargs):
-            if url.endswith("/meta/info"):
-                return meta_response
-            elif url.endswith("/cameras"):
-                return cameras_response
-            else:
-                return meta_response
-        
-        instance.get = mock_get
-        instance.aclose = AsyncMock()
-        
+    # Mock successful connection but empty camera list
+    with patch_unifi_api(cameras_json=[]):
         # Add integration
+        create_unifi_integration(page, live_server_url)
         page.goto(f"{live_server_url}/settings/integrations")
-        page.get_by_role("button", name="Add Integration").click()
-        page.get_by_role("link", name="UniFi Protect Connect to").click()
-        page.fill('input[name="host"]', "https://192.168.1.1")
-        page.fill('input[name="api_key"]', "test-api-key-123")
-        page.get_by_role("button", name="Connect").click()
-        page.wait_for_load_state("domcontentloaded")
         
         # Click Select Cameras button
         page.get_by_role("button", name="Select Cameras").click()
@@ -237,63 +241,20 @@ def test_unifi_camera_selection_empty(page: Page, live_server_url, clean_db):
         expect(page.get_by_text("No cameras found")).to_be_visible(timeout=5000)
 
 
-def test_unifi_delete_integration(page: Page, mock_unifi_api, live_server_url, clean_db):
+def test_unifi_delete_integration(page: Page, unifi_integration, live_server_url):
     """Test deleting a UniFi integration."""
-    # First add an integration
-    page.goto(f"{live_server_url}/settings/integrations")
-    page.get_by_role("button", name="Add Integration").click()
-    page.get_by_role("link", name="UniFi Protect Connect to").click()
-    page.fill('input[name="host"]', "https://192.168.1.1")
-    page.fill('input[name="api_key"]', "test-api-key-123")
-    page.get_by_role("button", name="Connect").click()
-    page.wait_for_load_state("domcontentloaded")
-    
-    # Click actions menu
-    page.locator(".dropdown .btn-ghost.btn-circle").first.click()
-    
-    # Click Delete
-    page.get_by_text("Delete").click()
+    # The actions menu and confirm dialog are exercised by the dummy integration tests
+    response = page.request.delete(f"{live_server_url}/api/integrations/{unifi_integration['id']}")
+    assert response.ok, response.text()
     
-    # Confirm deletion in dialog
-    page.on("dialog", lambda dialog: dialog.accept())
-    
-    # Wait for page reload and verify integration is gone
-    page.wait_for_load_state("domcontentloaded")
+    # Verify integration is gone
+    page.goto(f"{live_server_url}/settings/integrations")
     expect(page.get_by_text("No integrations configured")).to_be_visible()
 
 
-def test_unifi_network_error_handling(page: Page, live_server_url, clean_db):
-    """Test network error handling for UniFi integration."""
-    with patch("app.integrations.unifi_protect.unifi_protect.httpx.AsyncClient") as mock_client:
-        instance = AsyncMock()
-        mock_client.return_value = instance
-        
-        # Mock network error
-        instance.get.side_effect = httpx.ConnectError("Connection refused")
-        instance.aclose = AsyncMock()
-        
-        page.goto(f"{live_server_url}/settings/integrations")
-        
-        # Add integration
-        page.get_by_role("button", name="Add Integration").click()
-        page.get_by_role("link", name="UniFi Protect Connect to").click()
-        page.fill('input[name="host"]', "https://192.168.1.1")
-        page.fill('input[name="api_key"]', "test-api-key-123")
-        page.get_by_role("button", name="Connect").click()
-        
-        # Wait for error status
-        page.wait_for_load_state("domcontentloaded")
-        expect(page.get_by_role("heading", name="UniFi Protect", exact=True)).to_be_visible()
-        expect(page.get_by_text("Error")).to_be_visible()
-
-
 def test_unifi_ssl_certificate_handling(page: Page, live_server_url, clean_db):
     """Test that self-signed certificates are handled properly."""
-    with patch("app.integrations.unifi_protect.unifi_protect.httpx.AsyncClient") as mock_client:
-        instance = AsyncMock()
-        mock_client.return_value = instance
-        
-        # Verify SSL context is configured
+    with patch_unifi_api() as mock_client:
         assert mock_client.call_args is None  # Not called yet
         
         # Add integration to trigger client creation
@@ -302,49 +263,29 @@ def test_unifi_ssl_certificate_handling(page: Page, live_server_url, clean_db):
         page.get_by_role("link", name="UniFi Protect Connect to").click()
         page.fill('input[name="host"]', "https://192.168.1.1")
         page.fill('input[name="api_key"]', "test-api-key-123")
-        
-        # Mock successful response
-        success_response = AsyncMock()
-        success_response.status_code = 200
-        success_response.json.return_value = {"applicationVersion": "4.0.53"}
-        instance.get.return_value = success_response
-        instance.aclose = AsyncMock()
-        
         page.get_by_role("button", name="Connect").click()
-        page.wait_for_load_state("domcontentloaded")
         
         # Verify connection was successful despite SSL
         expect(page.get_by_text("Connected")).to_be_visible()
+        
+        # Verify the client was created without certificate verification
+        assert mock_client.call_args.kwargs["verify"] is False
 
 
-def test_unifi_update_camera_selection(page: Page, mock_unifi_api, live_server_url, clean_db):
+def test_unifi_update_camera_selection(page: Page, unifi_integration, live_server_url):
     """Test updating camera selection after initial setup."""
-    # First add an integration with one camera selected
+    # Select first camera only; the dialog itself is covered by test_unifi_camera_selection
+    select_unifi_cameras(page, live_server_url, unifi_integration["id"], ["camera1"])
     page.goto(f"{live_server_url}/settings/integrations")
-    page.get_by_role("button", name="Add Integration").click()
-    page.get_by_role("link", name="UniFi Protect Connect to").click()
-    page.fill('input[name="host"]', "https://192.168.1.1")
-    page.fill('input[name="api_key"]', "test-api-key-123")
-    page.get_by_role("button", name="Connect").click()
-    page.wait_for_load_state("domcontentloaded")
-    
-    # Select first camera only
-    page.get_by_role("button", name="Select Cameras").click()
-    page.locator('input[value="camera1"]').check()
-    page.locator('input[value="camera2"]').uncheck()
-    page.get_by_role("button", name="Save Selection").click()
-    page.wait_for_load_state("domcontentloaded")
     
     # Verify only one camera is shown
     expect(page.get_by_text("Front Door Camera")).to_be_visible()
     expect(page.get_by_text("Backyard Camera")).not_to_be_visible()
     
     # Update selection to include both cameras
-    page.get_by_role("button", name="Select Cameras").click()
-    page.locator('input[value="camera2"]').check()
-    page.get_by_role("button", name="Save Selection").click()
-    page.wait_for_load_state("domcontentloaded")
+    select_unifi_cameras(page, live_server_url, unifi_integration["id"], ["camera1", "camera2"])
+    page.reload()
     
     # Verify both cameras are now shown
     expect(page.get_by_text("Front Door Camera")).to_be_visible()
-    expect(page.get_by_text("Backyard Camera")).to_be_visible()
\ No newline at end of file
+    expect(page.get_by_text("Backyard Camera")).to_be_visible()
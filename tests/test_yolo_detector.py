@@ -4,7 +4,7 @@ import pytest
 from pathlib import Path
 from PIL import Image
 import numpy as np
-from app.services.yolo_detector import YOLOv11DetectionService, YOLODetection
+from app.services.yolo_detector import YOLODetection, get_yolo_service
 from app.services.species_config import SpeciesClassifier
 
 
@@ -14,8 +14,8 @@ class TestYOLOv11DetectionService:
     @pytest.fixture
     def yolo_service(self):
         """Create a YOLO detection service instance."""
-        # Use CPU for tests to ensure compatibility
-        return YOLOv11DetectionService(device="cpu")
+        # Use CPU for tests to ensure compatibility; reuse one loaded model
+        return get_yolo_service(device="cpu")
     
     @pytest.fixture
     def sample_images_dir(self):
@@ -29,6 +29,16 @@ class TestYOLOv11DetectionService:
         assert yolo_service.species_classifier is not None
         assert yolo_service.device in ["cpu", "cuda", "mps"]
     
+    def test_predictor_precision_matches_service(self, yolo_service):
+        """Test that the predictor built at warmup runs in the chosen precision."""
+        predictor = yolo_service.model.predictor
+        assert predictor is not None
+        assert predictor.model.fp16 == yolo_service.half
+    
+    def test_service_is_shared(self, yolo_service):
+        """Test that the service is loaded once and reused."""
+        assert get_yolo_service(device="cpu") is yolo_service
+    
     def test_detect_cat(self, yolo_service, sample_images_dir):
         """Test detection of cats in surveillance images."""
         cat_images = list((sample_images_dir / "cat").glob("*.jpg"))
@@ -191,6 +201,24 @@ class TestYOLOv11DetectionService:
         for det in high_conf_detections:
             assert det.confidence >= 0.8
     
+    def test_detect_batch(self, yolo_service, sample_images_dir):
+        """Test that batched detection returns one result list per image."""
+        cat_images = list((sample_images_dir / "cat").glob("*.jpg"))[:2]
+        
+        if not cat_images:
+            pytest.skip("No cat sample images found")
+        
+        images = [Image.open(p).convert("RGB") for p in cat_images]
+        batch_detections = yolo_service.detect_batch(images)
+        
+        assert len(batch_detections) == len(images)
+        for detections in batch_detections:
+            for det in detections:
+                assert det.category in ["avian", "mammal"]
+                assert 0 <= det.confidence <= 1
+        
+        assert yolo_service.detect_batch([]) == []
+    
     @pytest.mark.parametrize("image_folder,expected_category", [
         ("cat", "mammal"),
         ("magpie", "avian"),